@@ -18,10 +18,12 @@ Domains:
 Methodology: Bayesian convergence — each independent domain updates the prior.
 """
 
+import argparse
 import math
-from datetime import datetime
+from bisect import bisect_right
 
 def print_header():
+    from datetime import datetime
     print("=" * 80)
     print("  CROSS-DOMAIN CONVERGENCE ANALYSIS v4.0")
     print("  Independent evidence streams → Bayesian convergence")
@@ -468,21 +470,67 @@ def pre_greek_domain():
 # BAYESIAN CONVERGENCE — THE MULTIPLICATIVE POWER
 # ============================================================================
 
-def bayesian_convergence(domain_results):
+# Verdict bands: a posterior at or above _VERDICT_THRESH[i] earns _VERDICT_TEXT[i + 1]
+_VERDICT_THRESH = (0.50, 0.70, 0.85, 0.95)
+_VERDICT_TEXT = (
+    "UNCERTAIN: Evidence is mixed",
+    "LIKELY: More evidence for than against",
+    "PROBABLE: Evidence favors Hurro-Urartian but uncertainties remain",
+    "HIGHLY PROBABLE: Multiple independent evidence streams converge",
+    "NEAR-CERTAIN: Cross-domain convergence strongly supports Hurro-Urartian",
+)
+
+
+def verdict_for(posterior):
+    return _VERDICT_TEXT[bisect_right(_VERDICT_THRESH, posterior)]
+
+
+def _posterior_kernel(prior, lrs):
+    # Same sequential odds update as bayesian_convergence, done once in
+    # log-odds space: logit(posterior) = logit(prior) + sum(log(LR)).
+    # Clamped LRs are finite and positive, so a prior of 0 or 1 stays put.
+    if prior <= 0:
+        return 0.0
+    if prior >= 1:
+        return 1.0
+    log_odds = math.log(prior / (1 - prior))
+    for lr in lrs:
+        log_odds += math.log(max(0.5, min(lr, 5.0)))
+    if log_odds < 0:
+        # exp(-log_odds) would overflow for tiny priors; this form can't
+        odds = math.exp(log_odds)
+        return odds / (1 + odds)
+    return 1 / (1 + math.exp(-log_odds))
+
+
+def bayesian_convergence_batch(prior, lr_matrix):
+    """Posterior for each row of likelihood ratios (e.g. a sweep over priors/LRs).
+
+    prior is a probability in [0, 1]; priors of 0 and 1 are returned
+    unchanged, as no finite likelihood ratio can move them.
+    """
+    return [_posterior_kernel(prior, lrs) for lrs in lr_matrix]
+
+
+def bayesian_convergence(domain_results, verbose=True):
+    # Prior: with ~10 plausible language families, prior for any one = 10%
+    prior = 0.10
+
+    if not verbose:
+        return _posterior_kernel(prior, [lr for _, lr in domain_results.values()])
+
+    posterior = prior
+
     print("\n" + "=" * 80)
     print("  BAYESIAN CROSS-DOMAIN CONVERGENCE")
     print("  Independent evidence streams → multiplicative probability update")
     print("=" * 80)
 
-    # Prior: with ~10 plausible language families, prior for any one = 10%
-    prior = 0.10
     print(f"\n  Prior probability (1 of ~10 candidates): {prior*100:.0f}%")
 
     print(f"\n  {'Domain':<40} │ {'Score':>6} │ {'LR':>6} │ {'Posterior':>10}")
     print("  " + "─" * 70)
 
-    posterior = prior
-
     for name, (score, lr) in domain_results.items():
         # Bayesian update: P(H|E) = P(E|H) * P(H) / P(E)
         # Using likelihood ratio as shorthand
@@ -501,16 +549,7 @@ def bayesian_convergence(domain_results):
     print(f"  ═══════════════════════════════════════════════════════════════════")
 
     # Interpretation
-    if posterior >= 0.95:
-        verdict = "NEAR-CERTAIN: Cross-domain convergence strongly supports Hurro-Urartian"
-    elif posterior >= 0.85:
-        verdict = "HIGHLY PROBABLE: Multiple independent evidence streams converge"
-    elif posterior >= 0.70:
-        verdict = "PROBABLE: Evidence favors Hurro-Urartian but uncertainties remain"
-    elif posterior >= 0.50:
-        verdict = "LIKELY: More evidence for than against"
-    else:
-        verdict = "UNCERTAIN: Evidence is mixed"
+    verdict = verdict_for(posterior)
 
     print(f"\n  VERDICT: {verdict}")
 
@@ -575,7 +614,13 @@ def comparison_table(domain_results, posterior):
 # ============================================================================
 
 if __name__ == "__main__":
-    print_header()
+    parser = argparse.ArgumentParser(description="Linear A cross-domain convergence analysis")
+    parser.add_argument("--quiet", action="store_true",
+                        help="skip the dated banner (for batch/scripted runs)")
+    args = parser.parse_args()
+
+    if not args.quiet:
+        print_header()
 
     # Collect all domain results
     domain_results = {}
@@ -7,7 +7,15 @@ expanded vocabulary, verbal morphology analysis, and Van Soesbergen readings.
 Goal: Push the 68% Hurrian fit as high as computationally defensible.
 """
 
+import io
+import sys
+from array import array
+from contextlib import redirect_stdout
 from datetime import datetime
+from functools import cache
+from operator import itemgetter
+from statistics import fmean
+from types import MappingProxyType
 
 def print_header():
     print("=" * 75)
@@ -19,7 +27,14 @@ def print_header():
 # ============================================================================
 # DIMENSION 1: PRE-GREEK VOWEL SYSTEM MATCH (NEW)
 # ============================================================================
-def pre_greek_vowel_analysis():
+def pre_greek_vowel_analysis(verbose=True):
+    # Score: pre-Greek vowel system match
+    pre_greek_vowel_fit = 95  # Near-perfect match
+    hurrian_hattusha_fit = 85  # Strong match to Hattusha dialect
+    combined = (pre_greek_vowel_fit + hurrian_hattusha_fit) / 2
+    if not verbose:
+        return combined
+
     print("\n" + "=" * 75)
     print("DIMENSION 1: PRE-GREEK VOWEL SYSTEM MATCH (NEW)")
     print("=" * 75)
@@ -62,10 +77,6 @@ def pre_greek_vowel_analysis():
     that preserved the archaic 3-vowel system.
 """)
 
-    # Score: pre-Greek vowel system match
-    pre_greek_vowel_fit = 95  # Near-perfect match
-    hurrian_hattusha_fit = 85  # Strong match to Hattusha dialect
-    combined = (pre_greek_vowel_fit + hurrian_hattusha_fit) / 2
     print(f"  Pre-Greek vowel system fit:    {pre_greek_vowel_fit}%")
     print(f"  Hurrian Hattusha dialect fit:   {hurrian_hattusha_fit}%")
     print(f"  Combined vowel system score:    {combined}%")
@@ -74,7 +85,13 @@ def pre_greek_vowel_analysis():
 # ============================================================================
 # DIMENSION 2: PRE-GREEK CONSONANT FEATURES (NEW)
 # ============================================================================
-def pre_greek_consonant_analysis():
+def pre_greek_consonant_analysis(verbose=True):
+    features_matched = 4  # all 4 consonant features match
+    features_total = 4
+    score = (features_matched / features_total) * 100
+    if not verbose:
+        return score
+
     print("\n" + "=" * 75)
     print("DIMENSION 2: PRE-GREEK CONSONANT FEATURES (NEW)")
     print("=" * 75)
@@ -110,9 +127,6 @@ def pre_greek_consonant_analysis():
      with Indo-European phonology."
 """)
 
-    features_matched = 4  # all 4 consonant features match
-    features_total = 4
-    score = (features_matched / features_total) * 100
     print(f"  Pre-Greek consonant features matched: {features_matched}/{features_total}")
     print(f"  Consonant system score: {score}%")
     return score
@@ -120,65 +134,86 @@ def pre_greek_consonant_analysis():
 # ============================================================================
 # DIMENSION 3: EXPANDED VOCABULARY (ENHANCED)
 # ============================================================================
-def expanded_vocabulary():
+# Stored column-wise: the score reductions below scan one contiguous int16
+# buffer instead of unpacking every row tuple.
+_VOCABULARY = [
+    # (Linear A, Comparand, Meaning, Source, Match Level, Score)
+    ("A-TA-I", "att-ai (Hurrian)", "father", "Hurrian", "NEAR-IDENTICAL", 95),
+    ("-ME (enclitic)", "-ame (Hurrian poss. 2sg)", "your", "Hurrian", "STRONG", 85),
+    ("-E (case)", "-e (Hurrian essive)", "as/in role of", "Hurrian", "EXACT", 100),
+    ("SA-SA-RA", "šarri (Hurrian)", "king/lord", "Hurrian", "STRONG", 80),
+    ("TA-N- (prefix)", "ta/na (Hurrian 3sg)", "this/that", "Hurrian", "STRONG", 80),
+    ("U-NA", "un- (Hurrian 'to come')", "come → present", "Hurrian", "MEDIUM", 60),
+    ("-TI (case)", "-ta/-da (Hurrian directive)", "toward", "Hurrian", "STRONG", 80),
+    ("-NA (case)", "-nna (Hurrian equative)", "of/like", "Hurrian", "STRONG", 80),
+    # NEW: Van Soesbergen readings
+    ("U-NA-KA-NA-SI", "un=a-ḫḫan=a=ssi", "come-childbirth", "Van Soesbergen", "SCHOLARLY", 75),
+    # NEW: Pre-Greek substrate matches
+    ("DA-KU-NA (Linear A)", "*dakwuna → daphne", "laurel", "Pre-Greek", "STRONG", 85),
+    ("I-DA-MA-TE", "Ida + mate = 'Ida Mother'", "mountain goddess", "Pre-Greek/Hurrian", "STRONG", 80),
+    ("DU-PU₂-RE", "power/kingship word", "Diktaean Master", "Linear A scholars", "MEDIUM", 65),
+    # NEW: Anatolian/Hurrian cultural vocabulary in Greek
+    ("*elephas", "laḫpa (Hittite)", "ivory/elephant", "Anatolian", "STRONG", 70),
+    ("*kyanos", "kuwannan- (Hittite)", "blue glaze", "Anatolian", "STRONG", 70),
+    ("*tolype", "taluppa (Hittite/Luwian)", "ball of wool", "Anatolian", "STRONG", 70),
+    # Matches that DON'T work (honest accounting)
+    ("I-PI-NA-MA", "no match found", "libation liquid", "—", "NO MATCH", 0),
+    ("SI-RU-TE", "no match found", "reverently?", "—", "NO MATCH", 0),
+    ("KU-RO", "kuru (Hurrian 'again')", "total", "Hurrian?", "WEAK", 25),
+]
+_LA_FORMS, _COMPARANDS, _MEANINGS, _SOURCES, _MATCHES, _score_column = zip(*_VOCABULARY)
+_SCORES = array('h', _score_column)
+del _VOCABULARY, _score_column
+
+def expanded_vocabulary(verbose=True):
+    count = len(_SCORES)
+    avg_score = fmean(_SCORES)
+    if not verbose:
+        return avg_score
+
     print("\n" + "=" * 75)
     print("DIMENSION 3: EXPANDED VOCABULARY COMPARISON (ENHANCED)")
     print("=" * 75)
 
-    vocabulary = [
-        # (Linear A, Comparand, Meaning, Source, Match Level, Score)
-        ("A-TA-I", "att-ai (Hurrian)", "father", "Hurrian", "NEAR-IDENTICAL", 95),
-        ("-ME (enclitic)", "-ame (Hurrian poss. 2sg)", "your", "Hurrian", "STRONG", 85),
-        ("-E (case)", "-e (Hurrian essive)", "as/in role of", "Hurrian", "EXACT", 100),
-        ("SA-SA-RA", "šarri (Hurrian)", "king/lord", "Hurrian", "STRONG", 80),
-        ("TA-N- (prefix)", "ta/na (Hurrian 3sg)", "this/that", "Hurrian", "STRONG", 80),
-        ("U-NA", "un- (Hurrian 'to come')", "come → present", "Hurrian", "MEDIUM", 60),
-        ("-TI (case)", "-ta/-da (Hurrian directive)", "toward", "Hurrian", "STRONG", 80),
-        ("-NA (case)", "-nna (Hurrian equative)", "of/like", "Hurrian", "STRONG", 80),
-        # NEW: Van Soesbergen readings
-        ("U-NA-KA-NA-SI", "un=a-ḫḫan=a=ssi", "come-childbirth", "Van Soesbergen", "SCHOLARLY", 75),
-        # NEW: Pre-Greek substrate matches
-        ("DA-KU-NA (Linear A)", "*dakwuna → daphne", "laurel", "Pre-Greek", "STRONG", 85),
-        ("I-DA-MA-TE", "Ida + mate = 'Ida Mother'", "mountain goddess", "Pre-Greek/Hurrian", "STRONG", 80),
-        ("DU-PU₂-RE", "power/kingship word", "Diktaean Master", "Linear A scholars", "MEDIUM", 65),
-        # NEW: Anatolian/Hurrian cultural vocabulary in Greek
-        ("*elephas", "laḫpa (Hittite)", "ivory/elephant", "Anatolian", "STRONG", 70),
-        ("*kyanos", "kuwannan- (Hittite)", "blue glaze", "Anatolian", "STRONG", 70),
-        ("*tolype", "taluppa (Hittite/Luwian)", "ball of wool", "Anatolian", "STRONG", 70),
-        # Matches that DON'T work (honest accounting)
-        ("I-PI-NA-MA", "no match found", "libation liquid", "—", "NO MATCH", 0),
-        ("SI-RU-TE", "no match found", "reverently?", "—", "NO MATCH", 0),
-        ("KU-RO", "kuru (Hurrian 'again')", "total", "Hurrian?", "WEAK", 25),
-    ]
-
     print(f"\n  {'Linear A':<22} │ {'Comparand':<28} │ {'Meaning':<18} │ {'Match':<15} │ Score")
     print("  " + "─" * 110)
 
-    total_score = 0
-    count = 0
-    for la, comp, meaning, source, match, score in vocabulary:
+    for la, comp, meaning, match, score in zip(_LA_FORMS, _COMPARANDS, _MEANINGS, _MATCHES, _SCORES):
         print(f"  {la:<22} │ {comp:<28} │ {meaning:<18} │ {match:<15} │ {score}%")
-        total_score += score
-        count += 1
 
-    avg_score = total_score / count
-    strong_matches = sum(1 for v in vocabulary if v[5] >= 70)
+    strong_matches = sum(1 for score in _SCORES if score >= 70)
 
     print(f"\n  Total vocabulary items compared: {count}")
     print(f"  Strong/Exact matches (≥70%): {strong_matches}/{count}")
     print(f"  Average vocabulary score: {avg_score:.1f}%")
 
     # Separate Hurrian-only vs combined
-    hurrian_items = [v for v in vocabulary if "Hurrian" in v[3] or "Van Soesbergen" in v[3]]
-    hurrian_avg = sum(v[5] for v in hurrian_items) / len(hurrian_items)
-    print(f"  Hurrian-specific matches: {hurrian_avg:.1f}% ({len(hurrian_items)} items)")
+    hurrian_scores = [score for source, score in zip(_SOURCES, _SCORES)
+                      if "Hurrian" in source or "Van Soesbergen" in source]
+    hurrian_avg = fmean(hurrian_scores)
+    print(f"  Hurrian-specific matches: {hurrian_avg:.1f}% ({len(hurrian_scores)} items)")
 
     return avg_score
 
 # ============================================================================
 # DIMENSION 4: VERBAL MORPHOLOGY MATCH (NEW)
 # ============================================================================
-def verbal_morphology():
+def verbal_morphology(verbose=True):
+    features = [
+        ("Agglutinative suffix chain", True, 100),
+        ("Transitivity vowel marker", True, 75),
+        ("Morpheme boundary alignment (Van Soesbergen)", True, 80),
+        ("Verb-final position (SOV)", True, 85),
+        ("Derivational infixing (-RU-)", True, 80),
+        ("Person agreement alternation (-SI/-TI)", True, 75),
+        ("Suffix count matches (5-6 morphemes)", True, 70),
+    ]
+
+    total = sum(s for _, m, s in features if m)
+    avg = total / len(features)
+    if not verbose:
+        return avg
+
     print("\n" + "=" * 75)
     print("DIMENSION 4: HURRIAN VERBAL MORPHOLOGY MATCH (NEW)")
     print("=" * 75)
@@ -230,19 +265,6 @@ def verbal_morphology():
   Derivational infixing              │   Yes   │ -RU-     │  YES
 """)
 
-    features = [
-        ("Agglutinative suffix chain", True, 100),
-        ("Transitivity vowel marker", True, 75),
-        ("Morpheme boundary alignment (Van Soesbergen)", True, 80),
-        ("Verb-final position (SOV)", True, 85),
-        ("Derivational infixing (-RU-)", True, 80),
-        ("Person agreement alternation (-SI/-TI)", True, 75),
-        ("Suffix count matches (5-6 morphemes)", True, 70),
-    ]
-
-    total = sum(s for _, m, s in features if m)
-    avg = total / len(features)
-
     print(f"\n  Verbal morphology features matched: {sum(1 for _,m,_ in features if m)}/{len(features)}")
     print(f"  Verbal morphology score: {avg:.1f}%")
     return avg
@@ -250,7 +272,15 @@ def verbal_morphology():
 # ============================================================================
 # DIMENSION 5: URARTIAN THREE-WAY COMPARISON (NEW)
 # ============================================================================
-def urartian_three_way():
+def urartian_three_way(verbose=True):
+    confirmed = 7
+    likely = 3
+    possible = 1
+    total_features = 11
+    score = ((confirmed * 1.0 + likely * 0.7 + possible * 0.3) / total_features) * 100
+    if not verbose:
+        return score
+
     print("\n" + "=" * 75)
     print("DIMENSION 5: URARTIAN THREE-WAY COMPARISON (NEW)")
     print("=" * 75)
@@ -287,11 +317,6 @@ def urartian_three_way():
   Minoan preserves ARCHAIC features of proto-Hurro-Urartian.
 """)
 
-    confirmed = 7
-    likely = 3
-    possible = 1
-    total_features = 11
-    score = ((confirmed * 1.0 + likely * 0.7 + possible * 0.3) / total_features) * 100
     print(f"  Three-way structural matches: {confirmed} confirmed + {likely} likely + {possible} possible")
     print(f"  Three-way comparison score: {score:.1f}%")
     return score
@@ -299,7 +324,18 @@ def urartian_three_way():
 # ============================================================================
 # DIMENSION 6: PRE-GREEK SUBSTRATE VOCABULARY (NEW)
 # ============================================================================
-def pre_greek_substrate():
+def pre_greek_substrate(verbose=True):
+    phonological_matches = 6
+    phonological_total = 8
+    vocab_confirmed = 2  # DA-KU-NA, DI-KI-TA
+    vocab_possible = 4
+
+    phon_score = (phonological_matches / phonological_total) * 100
+    vocab_score = ((vocab_confirmed * 1.0 + vocab_possible * 0.4) / (vocab_confirmed + vocab_possible)) * 100
+    combined = (phon_score + vocab_score) / 2
+    if not verbose:
+        return combined
+
     print("\n" + "=" * 75)
     print("DIMENSION 6: PRE-GREEK SUBSTRATE ANALYSIS (NEW)")
     print("=" * 75)
@@ -350,15 +386,6 @@ def pre_greek_substrate():
     The cultural sphere is CONSISTENT.
 """)
 
-    phonological_matches = 6
-    phonological_total = 8
-    vocab_confirmed = 2  # DA-KU-NA, DI-KI-TA
-    vocab_possible = 4
-
-    phon_score = (phonological_matches / phonological_total) * 100
-    vocab_score = ((vocab_confirmed * 1.0 + vocab_possible * 0.4) / (vocab_confirmed + vocab_possible)) * 100
-    combined = (phon_score + vocab_score) / 2
-
     print(f"\n  Phonological profile match: {phonological_matches}/{phonological_total} ({phon_score:.0f}%)")
     print(f"  Vocabulary reconstruction match: {vocab_score:.0f}%")
     print(f"  Pre-Greek substrate score: {combined:.1f}%")
@@ -367,7 +394,20 @@ def pre_greek_substrate():
 # ============================================================================
 # DIMENSION 7: RELIGIOUS/CULTURAL CONTEXT (ENHANCED)
 # ============================================================================
-def religious_context():
+def religious_context(verbose=True):
+    parallels = [
+        ("Mountain deity cult", True, 90),
+        ("Divine triad structure", True, 85),
+        ("Place + Title theonymy", True, 85),
+        ("Peak sanctuary rituals", True, 90),
+        ("Libation as central ritual", True, 80),
+        ("SA-SA-RA-ME ↔ Šarruma reading", True, 75),
+    ]
+
+    avg = fmean(s for _, m, s in parallels)
+    if not verbose:
+        return avg
+
     print("\n" + "=" * 75)
     print("DIMENSION 7: RELIGIOUS/CULTURAL CONTEXT (ENHANCED)")
     print("=" * 75)
@@ -410,16 +450,6 @@ def religious_context():
      → Both have libation rituals at mountain shrines
 """)
 
-    parallels = [
-        ("Mountain deity cult", True, 90),
-        ("Divine triad structure", True, 85),
-        ("Place + Title theonymy", True, 85),
-        ("Peak sanctuary rituals", True, 90),
-        ("Libation as central ritual", True, 80),
-        ("SA-SA-RA-ME ↔ Šarruma reading", True, 75),
-    ]
-
-    avg = sum(s for _, m, s in parallels) / len(parallels)
     print(f"\n  Religious/cultural parallels: {len(parallels)}/{len(parallels)} matched")
     print(f"  Religious context score: {avg:.1f}%")
     return avg
@@ -427,7 +457,12 @@ def religious_context():
 # ============================================================================
 # DIMENSION 8: CASE SYSTEM (REVISED WITH DEEPER DATA)
 # ============================================================================
-def case_system_revised():
+def case_system_revised(verbose=True):
+    scores = [100, 95, 85, 85, 50, 45]
+    avg = fmean(scores)
+    if not verbose:
+        return avg
+
     print("\n" + "=" * 75)
     print("DIMENSION 8: CASE SYSTEM COMPARISON (REVISED)")
     print("=" * 75)
@@ -461,8 +496,6 @@ def case_system_revised():
     -JA:  45 (slightly upgraded from 30)
 """)
 
-    scores = [100, 95, 85, 85, 50, 45]
-    avg = sum(scores) / len(scores)
     print(f"\n  Revised case system average: {avg:.1f}%")
     return avg
 
@@ -482,7 +515,11 @@ def existing_dimensions():
 # ============================================================================
 # DIMENSION 13: SCHOLARLY SUPPORT (NEW)
 # ============================================================================
-def scholarly_support():
+def scholarly_support(verbose=True):
+    support_score = 70  # Strong but not unanimous
+    if not verbose:
+        return support_score
+
     print("\n" + "=" * 75)
     print("DIMENSION 13: SCHOLARLY CONSENSUS / SUPPORT (NEW)")
     print("=" * 75)
@@ -524,58 +561,24 @@ def scholarly_support():
   produced a comparable level of systematic analysis.
 """)
 
-    support_score = 70  # Strong but not unanimous
     print(f"  Scholarly support score: {support_score}%")
     return support_score
 
 # ============================================================================
 # FINAL SYNTHESIS
 # ============================================================================
-def final_synthesis():
-    print("\n" + "=" * 75)
-    print("  FINAL ENHANCED SYNTHESIS — ALL DIMENSIONS")
-    print("=" * 75)
-
-    # Run all analyses
-    scores = {}
-    scores["1. Pre-Greek vowel system"] = pre_greek_vowel_analysis()
-    scores["2. Pre-Greek consonants"] = pre_greek_consonant_analysis()
-    scores["3. Expanded vocabulary"] = expanded_vocabulary()
-    scores["4. Verbal morphology"] = verbal_morphology()
-    scores["5. Urartian three-way"] = urartian_three_way()
-    scores["6. Pre-Greek substrate"] = pre_greek_substrate()
-    scores["7. Religious/cultural"] = religious_context()
-    scores["8. Case system (revised)"] = case_system_revised()
-
-    # Add existing dimensions
-    for name, score in existing_dimensions().items():
-        scores[name] = score
-
-    scores["13. Scholarly support"] = scholarly_support()
-
-    # Print final table
-    print("\n" + "=" * 75)
-    print("  COMPREHENSIVE SCORING TABLE")
-    print("=" * 75)
-    print(f"\n  {'Dimension':<40} │ {'Score':>6}")
-    print("  " + "─" * 50)
-
-    total = 0
-    count = 0
-    for name, score in sorted(scores.items()):
-        marker = " ★" if score >= 80 else ""
-        print(f"  {name:<40} │ {score:>5.1f}%{marker}")
-        total += score
-        count += 1
-
-    overall = total / count
-
-    print("  " + "─" * 50)
-    print(f"  {'OVERALL ENHANCED FIT':<40} │ {overall:>5.1f}%")
-    print(f"  {'Previous v1 fit':<40} │ {'68.1'}%")
-    print(f"  {'Improvement':<40} │ +{overall - 68.1:>4.1f}%")
-
-    print(f"""
+_DIMENSIONS = (
+    ("1. Pre-Greek vowel system", pre_greek_vowel_analysis),
+    ("2. Pre-Greek consonants", pre_greek_consonant_analysis),
+    ("3. Expanded vocabulary", expanded_vocabulary),
+    ("4. Verbal morphology", verbal_morphology),
+    ("5. Urartian three-way", urartian_three_way),
+    ("6. Pre-Greek substrate", pre_greek_substrate),
+    ("7. Religious/cultural", religious_context),
+    ("8. Case system (revised)", case_system_revised),
+)
+
+_VERDICT_TEMPLATE = """
   ═══════════════════════════════════════════════════════════════════════
   ENHANCED VERDICT (v2.0)
   ═══════════════════════════════════════════════════════════════════════
@@ -595,9 +598,9 @@ def final_synthesis():
     + Scholarly consensus assessment
 
   WHAT THIS MEANS:
-""")
-    if overall >= 78:
-        print(f"""  At {overall:.1f}%, we are now at the THRESHOLD of confirmed language
+"""
+
+_THRESHOLD_TEMPLATE = """  At {overall:.1f}%, we are now at the THRESHOLD of confirmed language
   family relationship. For comparison:
     - Random language pair: ~15-20%
     - Distant relatives: ~40-60% (e.g., English-Hindi)
@@ -614,9 +617,9 @@ def final_synthesis():
   │                                                                 │
   │   This is the STRONGEST computationally-supported claim for    │
   │   the linguistic identity of the Minoan language ever made.    │
-  └──────────────────────────────────────────────────────────────────┘""")
+  └──────────────────────────────────────────────────────────────────┘"""
 
-    print(f"""
+_GAPS_TEMPLATE = """
   REMAINING GAPS (what would push toward 90%+):
     - Sign *301 remains unread (critical for α position)
     - I-PI-NA-MA and SI-RU-TE have NO parallels in ANY language
@@ -636,12 +639,63 @@ def final_synthesis():
   From 68% → {overall:.1f}% through multi-dimensional expansion.
   This narrows a 3,500-year mystery to its tightest-ever constraint.
   ═══════════════════════════════════════════════════════════════════════
-""")
+"""
+
+def _collect_scores(verbose):
+    scores = {name: fn(verbose=verbose) for name, fn in _DIMENSIONS}
+    # Add existing dimensions
+    scores.update(existing_dimensions())
+    scores["13. Scholarly support"] = scholarly_support(verbose=verbose)
+    return scores
+
+@cache
+def dimension_scores():
+    """All dimension scores, computed once without printing the analyses"""
+    return MappingProxyType(_collect_scores(verbose=False))
+
+def final_synthesis(verbose=True):
+    print("\n" + "=" * 75)
+    print("  FINAL ENHANCED SYNTHESIS — ALL DIMENSIONS")
+    print("=" * 75)
+
+    # Run all analyses (printing each one), or reuse the cached scores
+    if verbose:
+        scores = _collect_scores(verbose=True)
+    else:
+        scores = dimension_scores()
+
+    # Print final table
+    print("\n" + "=" * 75)
+    print("  COMPREHENSIVE SCORING TABLE")
+    print("=" * 75)
+    print(f"\n  {'Dimension':<40} │ {'Score':>6}")
+    print("  " + "─" * 50)
+
+    rows = [f"  {name:<40} │ {score:>5.1f}%{' ★' if score >= 80 else ''}"
+            for name, score in sorted(scores.items(), key=itemgetter(0))]
+    print("\n".join(rows))
+
+    overall = fmean(scores.values())
+
+    print("  " + "─" * 50)
+    print(f"  {'OVERALL ENHANCED FIT':<40} │ {overall:>5.1f}%")
+    print(f"  {'Previous v1 fit':<40} │ {'68.1'}%")
+    print(f"  {'Improvement':<40} │ +{overall - 68.1:>4.1f}%")
+
+    print(_VERDICT_TEMPLATE.format(overall=overall))
+    if overall >= 78:
+        print(_THRESHOLD_TEMPLATE.format(overall=overall))
+
+    print(_GAPS_TEMPLATE.format(overall=overall))
     return overall
 
 # ============================================================================
 # MAIN
 # ============================================================================
 if __name__ == "__main__":
-    print_header()
-    final_score = final_synthesis()
+    # Collect the whole report and write it to stdout in one go
+    with redirect_stdout(io.StringIO()) as report:
+        print_header()
+        final_score = final_synthesis()
+
+    sys.stdout.write(report.getvalue())
@@ -6,13 +6,27 @@ The critical test: Does Hurrian grammar actually FIT the Linear A data?
 Not cherry-picking parallels — systematic comparison across every dimension.
 """
 
-from collections import defaultdict
+import io
+import sys
+from contextlib import redirect_stdout
+from functools import cache
+from statistics import fmean
+from types import MappingProxyType
+
+
+def _frozen(table):
+    """Read-only view of a reference table, with interned keys (nested tables too)."""
+    return MappingProxyType({
+        sys.intern(k): _frozen(v) if isinstance(v, dict) else v
+        for k, v in table.items()
+    })
+
 
 # =============================================================================
 # HURRIAN GRAMMAR DATA (from Wegner, Grokipedia, academic sources)
 # =============================================================================
 
-HURRIAN_CASES = {
+HURRIAN_CASES = _frozen({
     "absolutive":   {"suffix": "∅",        "function": "intransitive subject, transitive object"},
     "ergative":     {"suffix": "-še",      "function": "transitive subject"},
     "genitive":     {"suffix": "-ašše/-ve","function": "possession, relation"},
@@ -25,9 +39,9 @@ HURRIAN_CASES = {
     "instrumental": {"suffix": "-ae",      "function": "means, instrument"},
     "essive":       {"suffix": "-e",       "function": "role, condition"},
     "adverbial":    {"suffix": "-nni",     "function": "quality, adverbial"},
-}
+})
 
-HURRIAN_VOCAB = {
+HURRIAN_VOCAB = _frozen({
     "att-ai":   "father",
     "šarri":    "king",
     "eni":      "god",
@@ -52,18 +66,18 @@ HURRIAN_VOCAB = {
     "tiššan":   "very",
     "šiglade":  "shekel",
     "tibni":    "straw",
-}
+})
 
-HURRIAN_POSSESSIVES = {
+HURRIAN_POSSESSIVES = _frozen({
     "1sg": "-iffu",
     "2sg": "-ame",
     "3sg": "-a",
     "1pl": "-iffu-ž",
     "2pl": "-ame-ž",
     "3pl": "-a-lla",
-}
+})
 
-HURRIAN_PRONOUNS = {
+HURRIAN_PRONOUNS = _frozen({
     "1sg": "ši",
     "2sg": "ti",
     "3sg_inan": "ta/na",
@@ -71,22 +85,22 @@ HURRIAN_PRONOUNS = {
     "1pl": "šime",
     "2pl": "time",
     "3pl": "illi",
-}
+})
 
 # =============================================================================
 # LINEAR A PROPOSED MORPHOLOGY
 # =============================================================================
 
-LINEAR_A_CASES = {
+LINEAR_A_CASES = _frozen({
     "proposed_dative":      {"suffix": "-SI",  "evidence": "U-NA-KA-NA-SI (verb: gives/pours to)"},
     "proposed_accusative":  {"suffix": "-TI",  "evidence": "TA-NU-MU-TI (demonstrative acc.)"},
     "proposed_genitive":    {"suffix": "-NA",  "evidence": "JA-SA-SA-RA-MA-NA (of the deity)"},
     "proposed_possessive":  {"suffix": "-ME",  "evidence": "JA-SA-SA-RA-ME (our/your deity)"},
     "proposed_ablative":    {"suffix": "-JA",  "evidence": "A-TA-I-*301-WA-JA (from/by)"},
     "proposed_essive":      {"suffix": "-E",   "evidence": "A-TA-I-*301-WA-E (as/in role of)"},
-}
+})
 
-LINEAR_A_VOCAB = {
+LINEAR_A_VOCAB = _frozen({
     "A-TA-I":       "father/divine father (α position)",
     "SA-SA-RA":     "deity root, 'holy one/king' (γ position)",
     "-ME":          "possessive enclitic 'my/our/your'",
@@ -97,7 +111,139 @@ LINEAR_A_VOCAB = {
     "KU-RO":        "total (administrative)",
     "PA-I-TO":      "Phaistos (place name)",
     "TA-N-":        "demonstrative prefix: this/the",
-}
+})
+
+# Points per phonetic/semantic match level in compare_case_systems
+_LEVEL_SCORES = {"EXACT": 4, "STRONG": 3, "MEDIUM": 2, "PARTIAL": 1, "POSSIBLE": 1, "WEAK": 0}
+
+_CASE_COMPARISONS = (
+    # (Linear A suffix, Hurrian case, Hurrian suffix, phonetic match, semantic match, notes)
+    ("-SI", "dative", "-va/-i",
+     "PARTIAL", "POSSIBLE",
+     "Hurrian dative -i could relate to -SI through sibilant extension.\n"
+     "         Alternatively, -SI may correspond to instrumental -ae through a different path.\n"
+     "         Weak phonetic match."),
+
+    ("-TI", "directive", "-ta/-da",
+     "STRONG", "STRONG",
+     "Hurrian directive -ta/-da marks 'direction toward' (goal of action).\n"
+     "         Linear A -TI appears on accusative demonstratives (TA-NU-MU-TI).\n"
+     "         -TI ↔ -ta: dental stop + vowel, very close."),
+
+    ("-NA", "equative/adverbial", "-nna/-nni",
+     "STRONG", "MEDIUM",
+     "Hurrian equative -nna means 'like, as, in the manner of'.\n"
+     "         Hurrian adverbial -nni marks adverbial quality.\n"
+     "         Linear A -NA appears where 'of/pertaining to' is expected.\n"
+     "         -NA ↔ -nna: nasal + a-vowel, excellent phonetic match."),
+
+    ("-ME", "possessive (2sg)", "-ame",
+     "STRONG", "STRONG",
+     "Hurrian possessive 2sg -ame = 'your'.\n"
+     "         Linear A -ME enclitic on deity names = possessive.\n"
+     "         JA-SA-SA-RA-ME = 'your [holy one]' (addressing deity)\n"
+     "         -ME ↔ -ame: exact match on the terminal syllable."),
+
+    ("-JA", "ablative?", "-tan/-dan",
+     "WEAK", "POSSIBLE",
+     "Hurrian ablative -tan/-dan doesn't match -JA phonetically.\n"
+     "         However, Hurrian locative -a could combine with j-glide.\n"
+     "         Alternatively, -JA may be a uniquely Minoan case marker.\n"
+     "         Weak match overall."),
+
+    ("-E", "essive", "-e",
+     "EXACT", "STRONG",
+     "Hurrian essive -e marks 'role, condition, being as'.\n"
+     "         Linear A -E appears where role/instrumental meaning fits.\n"
+     "         A-TA-I-*301-WA-E = 'the father-[?]-as [role]'.\n"
+     "         -E ↔ -e: IDENTICAL."),
+)
+
+_VOCAB_COMPARISONS = (
+    ("A-TA-I", "att-ai", "father",
+     "NEAR-IDENTICAL",
+     "Linear A a-ta-i maps directly to Hurrian att-ai 'father'.\n"
+     "The geminate -tt- in Hurrian would be written as single -T- in CV syllabary.\n"
+     "This is the STRONGEST lexical match in the entire comparison."),
+
+    ("SA-SA-RA", "šarri", "king/lord",
+     "STRONG",
+     "Linear A sa-sa-ra shows apparent reduplication of the first syllable.\n"
+     "Hurrian šarri = 'king'. If SA = ša and RA = ri (plausible),\n"
+     "then SA-SA-RA could be a reduplicated form šaššari or similar.\n"
+     "Reduplication for emphasis/intensification is common in Near Eastern languages."),
+
+    ("-ME (enclitic)", "-ame (poss. 2sg)", "your",
+     "STRONG",
+     "Hurrian possessive 2sg suffix is -ame. Linear A enclitic is -ME.\n"
+     "If the initial a- was absorbed into the preceding word, -ame → -ME.\n"
+     "Contextually: JA-SA-SA-RA-ME = 'your king/lord' in prayer = reverent address."),
+
+    ("TA-N- (prefix)", "ta/na (3sg inan. pronoun)", "this/that",
+     "STRONG",
+     "Hurrian 3sg inanimate pronoun is ta or na.\n"
+     "Linear A TA-N- prefix functions as demonstrative 'this'.\n"
+     "TA-NA = ta + na = 'this [thing]' — using both forms for emphasis."),
+
+    ("U-NA (verb root)", "un- (to come)", "come → bring → give?",
+     "MEDIUM",
+     "Hurrian un- = 'to come'. Linear A U-NA- appears as verb of offering.\n"
+     "Semantic shift: 'come' → 'bring' → 'present/give' is cross-linguistically common.\n"
+     "The -NA extension could be a Minoan verbal suffix not present in std. Hurrian."),
+
+    ("KU-RO (total)", "kuru (again)", "sum/total?",
+     "WEAK",
+     "Hurrian kuru = 'again/furthermore'. Linear A KU-RO = 'total'.\n"
+     "Phonetically close but semantically divergent.\n"
+     "POSSIBLE connection: 'again' → 'in addition' → 'sum total' (semantic chain)\n"
+     "but this requires multiple semantic shifts. Likely coincidence or loan."),
+
+    ("I-PI-NA-MA", "no clear match", "substance/liquid",
+     "NO MATCH",
+     "No Hurrian word closely resembles I-PI-NA-MA.\n"
+     "This may be a native Minoan word for a specific substance (oil? wine?)\n"
+     "or a word borrowed from a third language."),
+
+    ("SI-RU-TE", "no clear match", "reverently/sacredly",
+     "NO MATCH",
+     "No Hurrian word closely resembles SI-RU-TE.\n"
+     "Possibly native Minoan or from a different contact language."),
+
+    ("DI-KI-TE", "Cretan place name", "Diktaean (Mt. Dikte)",
+     "N/A (NOT HURRIAN)",
+     "This is a Cretan toponym, not expected to have Hurrian origin.\n"
+     "The place name predates any Hurrian influence."),
+)
+
+# Indent the multi-line notes for the detailed-notes printout once, at load
+_CASE_COMPARISONS = tuple((*row[:-1], "    " + row[-1].replace("\n", "\n    ")) for row in _CASE_COMPARISONS)
+_VOCAB_COMPARISONS = tuple((*row[:-1], "    " + row[-1].replace("\n", "\n    ")) for row in _VOCAB_COMPARISONS)
+
+
+@cache
+def _case_scores():
+    """(strong phonetic, strong semantic, phonetic score, semantic score, max score)"""
+    # Column view: scoring scans the level columns, not whole rows
+    phon_levels = tuple(c[3] for c in _CASE_COMPARISONS)
+    sem_levels = tuple(c[4] for c in _CASE_COMPARISONS)
+    strong_phonetic = sum(1 for p in phon_levels if p in ("STRONG", "EXACT"))
+    strong_semantic = sem_levels.count("STRONG")
+
+    # Score (every level must be in _LEVEL_SCORES: an unknown one raises KeyError)
+    level_score = _LEVEL_SCORES.__getitem__
+    phon_score = sum(map(level_score, phon_levels))
+    sem_score = sum(map(level_score, sem_levels))
+    max_score = 4 * len(_CASE_COMPARISONS)
+    return strong_phonetic, strong_semantic, phon_score, sem_score, max_score
+
+
+@cache
+def _vocab_scores():
+    """(strong/near-identical matches, testable comparisons)"""
+    levels = tuple(c[3] for c in _VOCAB_COMPARISONS)
+    strong_matches = sum(1 for level in levels if level in ("NEAR-IDENTICAL", "STRONG"))
+    total_testable = len(levels) - levels.count("N/A (NOT HURRIAN)")
+    return strong_matches, total_testable
 
 
 def compare_case_systems():
@@ -106,81 +252,27 @@ def compare_case_systems():
     print("CASE SYSTEM COMPARISON: HURRIAN ↔ LINEAR A (MINOAN)")
     print("=" * 75)
 
-    comparisons = [
-        # (Linear A suffix, Hurrian case, Hurrian suffix, phonetic match, semantic match, notes)
-        ("-SI", "dative", "-va/-i",
-         "PARTIAL", "POSSIBLE",
-         "Hurrian dative -i could relate to -SI through sibilant extension.\n"
-         "         Alternatively, -SI may correspond to instrumental -ae through a different path.\n"
-         "         Weak phonetic match."),
-
-        ("-TI", "directive", "-ta/-da",
-         "STRONG", "STRONG",
-         "Hurrian directive -ta/-da marks 'direction toward' (goal of action).\n"
-         "         Linear A -TI appears on accusative demonstratives (TA-NU-MU-TI).\n"
-         "         -TI ↔ -ta: dental stop + vowel, very close."),
-
-        ("-NA", "equative/adverbial", "-nna/-nni",
-         "STRONG", "MEDIUM",
-         "Hurrian equative -nna means 'like, as, in the manner of'.\n"
-         "         Hurrian adverbial -nni marks adverbial quality.\n"
-         "         Linear A -NA appears where 'of/pertaining to' is expected.\n"
-         "         -NA ↔ -nna: nasal + a-vowel, excellent phonetic match."),
-
-        ("-ME", "possessive (2sg)", "-ame",
-         "STRONG", "STRONG",
-         "Hurrian possessive 2sg -ame = 'your'.\n"
-         "         Linear A -ME enclitic on deity names = possessive.\n"
-         "         JA-SA-SA-RA-ME = 'your [holy one]' (addressing deity)\n"
-         "         -ME ↔ -ame: exact match on the terminal syllable."),
-
-        ("-JA", "ablative?", "-tan/-dan",
-         "WEAK", "POSSIBLE",
-         "Hurrian ablative -tan/-dan doesn't match -JA phonetically.\n"
-         "         However, Hurrian locative -a could combine with j-glide.\n"
-         "         Alternatively, -JA may be a uniquely Minoan case marker.\n"
-         "         Weak match overall."),
-
-        ("-E", "essive", "-e",
-         "EXACT", "STRONG",
-         "Hurrian essive -e marks 'role, condition, being as'.\n"
-         "         Linear A -E appears where role/instrumental meaning fits.\n"
-         "         A-TA-I-*301-WA-E = 'the father-[?]-as [role]'.\n"
-         "         -E ↔ -e: IDENTICAL."),
-    ]
-
-    strong_phonetic = 0
-    strong_semantic = 0
-    total = len(comparisons)
+    strong_phonetic, strong_semantic, phon_score, sem_score, max_score = _case_scores()
+    total = len(_CASE_COMPARISONS)
 
     print(f"\n{'Lin-A':>6s} │ {'Hurrian Case':<15s} │ {'Hurr. Suffix':<14s} │ {'Phon.':>8s} │ {'Sem.':>8s}")
     print(f"{'─' * 72}")
 
-    for la_sfx, h_case, h_sfx, phon, sem, notes in comparisons:
-        print(f"{la_sfx:>6s} │ {h_case:<15s} │ {h_sfx:<14s} │ {phon:>8s} │ {sem:>8s}")
-        if phon in ("STRONG", "EXACT"):
-            strong_phonetic += 1
-        if sem in ("STRONG",):
-            strong_semantic += 1
+    rows = [f"{la_sfx:>6s} │ {h_case:<15s} │ {h_sfx:<14s} │ {phon:>8s} │ {sem:>8s}"
+            for la_sfx, h_case, h_sfx, phon, sem, notes in _CASE_COMPARISONS]
+    print("\n".join(rows))
 
     print(f"{'─' * 72}")
     print(f"\n  Strong/Exact phonetic matches: {strong_phonetic}/{total}")
     print(f"  Strong semantic matches:       {strong_semantic}/{total}")
 
-    # Score
-    score_map = {"EXACT": 4, "STRONG": 3, "MEDIUM": 2, "PARTIAL": 1, "POSSIBLE": 1, "WEAK": 0}
-    phon_score = sum(score_map.get(p, 0) for _, _, _, p, _, _ in comparisons)
-    sem_score = sum(score_map.get(s, 0) for _, _, _, _, s, _ in comparisons)
-    max_score = 4 * total
-
     print(f"\n  Phonetic match score:  {phon_score}/{max_score} ({phon_score/max_score*100:.0f}%)")
     print(f"  Semantic match score:  {sem_score}/{max_score} ({sem_score/max_score*100:.0f}%)")
 
     print(f"\n  DETAILED NOTES:")
-    for la_sfx, h_case, h_sfx, phon, sem, notes in comparisons:
+    for la_sfx, h_case, h_sfx, phon, sem, notes in _CASE_COMPARISONS:
         print(f"\n    {la_sfx} ↔ Hurrian {h_case} ({h_sfx}):")
-        for line in notes.split("\n"):
-            print(f"    {line}")
+        print(notes)
 
     return phon_score, sem_score, max_score
 
@@ -191,94 +283,27 @@ def compare_vocabulary():
     print("VOCABULARY COMPARISON: LINEAR A ↔ HURRIAN")
     print("=" * 75)
 
-    comparisons = [
-        ("A-TA-I", "att-ai", "father",
-         "NEAR-IDENTICAL",
-         "Linear A a-ta-i maps directly to Hurrian att-ai 'father'.\n"
-         "The geminate -tt- in Hurrian would be written as single -T- in CV syllabary.\n"
-         "This is the STRONGEST lexical match in the entire comparison."),
-
-        ("SA-SA-RA", "šarri", "king/lord",
-         "STRONG",
-         "Linear A sa-sa-ra shows apparent reduplication of the first syllable.\n"
-         "Hurrian šarri = 'king'. If SA = ša and RA = ri (plausible),\n"
-         "then SA-SA-RA could be a reduplicated form šaššari or similar.\n"
-         "Reduplication for emphasis/intensification is common in Near Eastern languages."),
-
-        ("-ME (enclitic)", "-ame (poss. 2sg)", "your",
-         "STRONG",
-         "Hurrian possessive 2sg suffix is -ame. Linear A enclitic is -ME.\n"
-         "If the initial a- was absorbed into the preceding word, -ame → -ME.\n"
-         "Contextually: JA-SA-SA-RA-ME = 'your king/lord' in prayer = reverent address."),
-
-        ("TA-N- (prefix)", "ta/na (3sg inan. pronoun)", "this/that",
-         "STRONG",
-         "Hurrian 3sg inanimate pronoun is ta or na.\n"
-         "Linear A TA-N- prefix functions as demonstrative 'this'.\n"
-         "TA-NA = ta + na = 'this [thing]' — using both forms for emphasis."),
-
-        ("U-NA (verb root)", "un- (to come)", "come → bring → give?",
-         "MEDIUM",
-         "Hurrian un- = 'to come'. Linear A U-NA- appears as verb of offering.\n"
-         "Semantic shift: 'come' → 'bring' → 'present/give' is cross-linguistically common.\n"
-         "The -NA extension could be a Minoan verbal suffix not present in std. Hurrian."),
-
-        ("KU-RO (total)", "kuru (again)", "sum/total?",
-         "WEAK",
-         "Hurrian kuru = 'again/furthermore'. Linear A KU-RO = 'total'.\n"
-         "Phonetically close but semantically divergent.\n"
-         "POSSIBLE connection: 'again' → 'in addition' → 'sum total' (semantic chain)\n"
-         "but this requires multiple semantic shifts. Likely coincidence or loan."),
-
-        ("I-PI-NA-MA", "no clear match", "substance/liquid",
-         "NO MATCH",
-         "No Hurrian word closely resembles I-PI-NA-MA.\n"
-         "This may be a native Minoan word for a specific substance (oil? wine?)\n"
-         "or a word borrowed from a third language."),
-
-        ("SI-RU-TE", "no clear match", "reverently/sacredly",
-         "NO MATCH",
-         "No Hurrian word closely resembles SI-RU-TE.\n"
-         "Possibly native Minoan or from a different contact language."),
-
-        ("DI-KI-TE", "Cretan place name", "Diktaean (Mt. Dikte)",
-         "N/A (NOT HURRIAN)",
-         "This is a Cretan toponym, not expected to have Hurrian origin.\n"
-         "The place name predates any Hurrian influence."),
-    ]
-
     print(f"\n{'Linear A':<18s} │ {'Hurrian':<20s} │ {'Meaning':<18s} │ {'Match Level'}")
     print(f"{'─' * 80}")
 
-    strong_matches = 0
-    total_testable = 0
+    strong_matches, total_testable = _vocab_scores()
 
-    for la, hurr, meaning, level, notes in comparisons:
-        if level != "N/A (NOT HURRIAN)":
-            total_testable += 1
-        print(f"{la:<18s} │ {hurr:<20s} │ {meaning:<18s} │ {level}")
-        if level in ("NEAR-IDENTICAL", "STRONG"):
-            strong_matches += 1
+    rows = [f"{la:<18s} │ {hurr:<20s} │ {meaning:<18s} │ {level}"
+            for la, hurr, meaning, level, notes in _VOCAB_COMPARISONS]
+    print("\n".join(rows))
 
     print(f"{'─' * 80}")
     print(f"\n  Strong/Near-identical matches: {strong_matches}/{total_testable}")
 
     print(f"\n  DETAILED ANALYSIS:")
-    for la, hurr, meaning, level, notes in comparisons:
+    for la, hurr, meaning, level, notes in _VOCAB_COMPARISONS:
         print(f"\n    {la} ↔ {hurr} ({level}):")
-        for line in notes.split("\n"):
-            print(f"    {line}")
+        print(notes)
 
     return strong_matches, total_testable
 
 
-def attempt_translations():
-    """Using the Hurrian framework, attempt full translations."""
-    print("\n" + "=" * 75)
-    print("TRANSLATION ATTEMPTS USING HURRIAN FRAMEWORK")
-    print("=" * 75)
-
-    print("""
+_TRANSLATIONS_TEXT = """
   ═══════════════════════════════════════════════════════════════════
   LIBATION FORMULA — BASE TYPE (Type #0)
   ═══════════════════════════════════════════════════════════════════
@@ -401,8 +426,16 @@ def attempt_translations():
   → TA-N- = Hurrian demonstrative ta/na = "this"     [HIGH CONF]
   → -TI ending on α → -MA-NA ending on γ (Rule III confirmed)
   → Shortened prayer for smaller/simpler offerings    [HIGH CONF]
-""")
+"""
+
+
+def attempt_translations():
+    """Using the Hurrian framework, attempt full translations."""
+    print("\n" + "=" * 75)
+    print("TRANSLATION ATTEMPTS USING HURRIAN FRAMEWORK")
+    print("=" * 75)
 
+    print(_TRANSLATIONS_TEXT)
 
 def score_overall():
     """Final scoring: how well does Hurrian fit Linear A?"""
@@ -433,13 +466,12 @@ def score_overall():
     print(f"\n{'Dimension':<30s} │ {'Fit %':>6s} │ Notes")
     print(f"{'─' * 90}")
 
-    total_score = 0
+    rows = []
     for dim, score, notes in dimensions:
-        bar = "█" * (score // 5)
-        print(f"{dim:<30s} │ {score:>5d}% │ {notes.split(chr(10))[0]}")
-        total_score += score
+        rows.append(f"{dim:<30s} │ {score:>5d}% │ {notes.split(chr(10))[0]}")
+    print("\n".join(rows))
 
-    avg = total_score / len(dimensions)
+    avg = fmean(score for _, score, _ in dimensions)
     print(f"{'─' * 90}")
     print(f"{'AVERAGE FIT':>30s} │ {avg:>5.1f}% │")
 
@@ -489,20 +521,24 @@ def score_overall():
 # =============================================================================
 
 if __name__ == "__main__":
-    print("╔═══════════════════════════════════════════════════════════════════════╗")
-    print("║  SYSTEMATIC HURRIAN ↔ LINEAR A COMPARISON                    ║")
-    print("║  Testing: Can Hurrian grammar decode Minoan?                          ║")
-    print("║  Date: 2026-02-27                                                     ║")
-    print("╚═══════════════════════════════════════════════════════════════════════╝")
-
-    phon_score, sem_score, max_score = compare_case_systems()
-    strong_vocab, total_vocab = compare_vocabulary()
-    attempt_translations()
-    avg_fit = score_overall()
-
-    print("=" * 75)
-    print(f"Analysis complete. Hurrian fit: {avg_fit:.0f}%")
-    print(f"Key finding: Minoan is likely a SISTER language of Hurrian,")
-    print(f"not Hurrian itself. This narrows 3,500 years of mystery to a")
-    print(f"specific language family for the first time with computational support.")
-    print("=" * 75)
+    # Collect the whole report and write it to stdout in one go
+    with redirect_stdout(io.StringIO()) as report:
+        print("╔═══════════════════════════════════════════════════════════════════════╗")
+        print("║  SYSTEMATIC HURRIAN ↔ LINEAR A COMPARISON                    ║")
+        print("║  Testing: Can Hurrian grammar decode Minoan?                          ║")
+        print("║  Date: 2026-02-27                                                     ║")
+        print("╚═══════════════════════════════════════════════════════════════════════╝")
+
+        phon_score, sem_score, max_score = compare_case_systems()
+        strong_vocab, total_vocab = compare_vocabulary()
+        attempt_translations()
+        avg_fit = score_overall()
+
+        print("=" * 75)
+        print(f"Analysis complete. Hurrian fit: {avg_fit:.0f}%")
+        print(f"Key finding: Minoan is likely a SISTER language of Hurrian,")
+        print(f"not Hurrian itself. This narrows 3,500 years of mystery to a")
+        print(f"specific language family for the first time with computational support.")
+        print("=" * 75)
+
+    sys.stdout.write(report.getvalue())
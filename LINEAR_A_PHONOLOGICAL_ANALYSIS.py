@@ -9,16 +9,20 @@ is diagnostic of language family. Hurrian sounds different from
 Semitic sounds different from Indo-European.
 """
 
-import math
+import io
+import re
+import sys
 from collections import Counter, defaultdict
-from itertools import combinations
+from contextlib import redirect_stdout
+from functools import cache
+from itertools import chain, takewhile
 
 # =============================================================================
 # SECTION 1: COMPLETE CORPUS — ALL READABLE LINEAR A WORDS
 # =============================================================================
 
 # All words from the libation formula variants
-LIBATION_WORDS = [
+LIBATION_WORDS = (
     # Type 0 (base)
     "a-ta-i-*301-wa-ja", "ja-di-ki-te-te-du-pu2-re", "ja-sa-sa-ra-me",
     "u-na-ka-na-si", "i-pi-na-ma", "si-ru-te",
@@ -35,10 +39,10 @@ LIBATION_WORDS = [
     "ta-na-i-*301-u-ti-nu",
     # Type 6 (IO Za 2.2)
     "ta-na-ra-te-u-ti-nu",
-]
+)
 
 # Known administrative/commodity words
-ADMIN_WORDS = [
+ADMIN_WORDS = (
     "ku-ro",        # total
     "po-to-ku-ro",  # grand total
     "pa-i-to",      # Phaistos
@@ -74,45 +78,66 @@ ADMIN_WORDS = [
     "su-ki-ri-ta",  # place name?
     "du-pu2-re",    # place/institution
     "a-ra-na-re",   # unknown
-]
+)
 
-ALL_WORDS = list(set(LIBATION_WORDS + ADMIN_WORDS))
+# Deduplicated in first-seen order, so tie-ordered output is stable across runs
+ALL_WORDS = tuple(dict.fromkeys(LIBATION_WORDS + ADMIN_WORDS))
 
 
+# C*V* split of a syllable
+_CV_RE = re.compile(r"([^aeiou]*)([aeiou]*)")
+_VOWELS = frozenset("aeiou")
+
+
+@cache
 def parse_syllables(word):
-    """Parse a hyphenated word into syllables, skip unknowns."""
+    """Parse a hyphenated word into a tuple of syllables, skip unknowns."""
     syls = []
     for s in word.split("-"):
         s = s.strip().lower()
         if s.startswith("*") or not s:
             continue  # skip unknown signs
         # Handle numbered variants: pu2 -> pu, pa3 -> pa, ra2 -> ra
-        clean = ""
-        for ch in s:
-            if ch.isalpha():
-                clean += ch
-            else:
-                break
+        clean = "".join(takewhile(str.isalpha, s))
         if clean:
             syls.append(clean)
-    return syls
+    return tuple(syls)
 
 
+@cache
 def extract_cv(syllable):
     """Extract consonant and vowel from a CV syllable."""
-    vowels = set("aeiou")
-    if len(syllable) == 1 and syllable in vowels:
-        return ("", syllable)  # pure vowel
-    elif len(syllable) >= 2:
-        consonant = ""
-        vowel = ""
-        for ch in syllable:
-            if ch in vowels:
-                vowel += ch
-            else:
-                consonant += ch
-        return (consonant, vowel)
-    return (syllable, "")
+    m = _CV_RE.fullmatch(syllable)
+    if m:
+        return m.groups()
+    # Not C*V* (does not occur in a CV syllabary): split letters by class
+    return ("".join(ch for ch in syllable if ch not in _VOWELS),
+            "".join(ch for ch in syllable if ch in _VOWELS))
+
+
+def _parse_word(word):
+    """(consonant, vowel) pair for every readable syllable of a word."""
+    return tuple(extract_cv(s) for s in parse_syllables(word))
+
+
+# Parsed once at import; every analysis below iterates this instead of
+# re-parsing ALL_WORDS.
+PARSED_WORDS = tuple((word, _parse_word(word)) for word in ALL_WORDS)
+
+# Each word's vowel sequence, shared by the vowel and harmony analyses
+WORD_VOWELS = tuple((word, tuple(v for _, v in cvs if v)) for word, cvs in PARSED_WORDS)
+
+# Prebuilt histogram bars up to 200 cells (100% at two cells per percent)
+_BARS = tuple("█" * i for i in range(201))
+
+
+def _bar(n):
+    # Same result as "█" * int(n): negative lengths give an empty bar, and
+    # lengths past the table are built directly
+    n = int(n)
+    if n < len(_BARS):
+        return _BARS[max(n, 0)]
+    return "█" * n
 
 
 # =============================================================================
@@ -121,33 +146,23 @@ def extract_cv(syllable):
 
 def analyze_vowels():
     """Analyze vowel frequency, distribution, and harmony patterns."""
+    import math
+
     print("=" * 70)
     print("VOWEL ANALYSIS")
     print("=" * 70)
 
-    all_vowels = []
-    word_vowels = []
-
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        wv = []
-        for s in syls:
-            _, v = extract_cv(s)
-            if v:
-                all_vowels.append(v)
-                wv.append(v)
-        if wv:
-            word_vowels.append((word, wv))
+    word_vowels = [(word, list(vowels)) for word, vowels in WORD_VOWELS if vowels]
 
-    freq = Counter(all_vowels)
-    total = len(all_vowels)
+    freq = Counter(chain.from_iterable(vowels for _, vowels in WORD_VOWELS))
+    total = freq.total()
 
     print(f"\nVowel frequency distribution ({total} total vowels):")
     print(f"{'─' * 40}")
     for v in "aeiou":
         count = freq.get(v, 0)
         pct = count / total * 100
-        bar = "█" * int(pct)
+        bar = _bar(pct)
         print(f"  {v}:  {count:3d}  ({pct:5.1f}%)  {bar}")
 
     # Compare to known language families
@@ -174,16 +189,13 @@ def analyze_vowels():
     # Calculate distance to each profile
     print(f"\n{'─' * 40}")
     print("EUCLIDEAN DISTANCE FROM MINOAN VOWEL PROFILE:")
-    minoan_profile = profiles["MINOAN (Linear A)"]
-    distances = []
-    for lang, profile in profiles.items():
-        if lang.startswith("MINOAN"):
-            continue
-        dist = math.sqrt(sum((minoan_profile[v] - profile[v])**2 for v in "aeiou"))
-        distances.append((lang, dist))
+    # One a/e/i/o/u vector per language; math.dist does the whole norm in C
+    vectors = {lang: tuple(profile[v] for v in "aeiou") for lang, profile in profiles.items()}
+    minoan_vector = vectors.pop("MINOAN (Linear A)")
+    distances = [(lang, math.dist(minoan_vector, vec)) for lang, vec in vectors.items()]
     distances.sort(key=lambda x: x[1])
     for lang, dist in distances:
-        bar = "█" * int(50 - dist)
+        bar = _bar(50 - dist)
         print(f"  {lang:<20s}  distance = {dist:6.2f}  {bar}")
 
     return freq, word_vowels, distances
@@ -199,29 +211,15 @@ def analyze_consonants():
     print("CONSONANT ANALYSIS")
     print("=" * 70)
 
-    all_consonants = []
-    initial_consonants = []
-    final_consonants = []
-
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        for idx, s in enumerate(syls):
-            c, v = extract_cv(s)
-            if c:
-                all_consonants.append(c)
-                if idx == 0:
-                    initial_consonants.append(c)
-                if idx == len(syls) - 1:
-                    final_consonants.append(c)
-
-    freq = Counter(all_consonants)
-    total = len(all_consonants)
+    # Counted straight from the parsed syllables, no intermediate lists
+    freq = Counter(c for _, cvs in PARSED_WORDS for c, _ in cvs if c)
+    total = freq.total()
 
     print(f"\nConsonant frequency ({total} total):")
     print(f"{'─' * 40}")
     for c, count in freq.most_common():
         pct = count / total * 100
-        bar = "█" * int(pct * 2)
+        bar = _bar(pct * 2)
         print(f"  {c:3s}:  {count:3d}  ({pct:5.1f}%)  {bar}")
 
     # Consonant classes
@@ -241,8 +239,8 @@ def analyze_consonants():
     # Word-initial consonant distribution
     print(f"\n{'─' * 40}")
     print("WORD-INITIAL CONSONANT FREQUENCY:")
-    init_freq = Counter(initial_consonants)
-    init_total = len(initial_consonants)
+    init_freq = Counter(cvs[0][0] for _, cvs in PARSED_WORDS if cvs and cvs[0][0])
+    init_total = init_freq.total()
     for c, count in init_freq.most_common():
         pct = count / init_total * 100
         print(f"  {c:3s}-:  {count:3d}  ({pct:5.1f}%)")
@@ -250,17 +248,13 @@ def analyze_consonants():
     # Consonant sequences (C1-V1-C2: what consonants follow what)
     print(f"\n{'─' * 40}")
     print("CONSONANT TRANSITIONS (C₁ → C₂ across syllable boundary):")
-    transitions = defaultdict(int)
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        for i in range(len(syls) - 1):
-            c1, _ = extract_cv(syls[i])
-            c2, _ = extract_cv(syls[i + 1])
-            if c1 and c2:
-                transitions[(c1, c2)] += 1
-
-    sorted_trans = sorted(transitions.items(), key=lambda x: -x[1])
-    for (c1, c2), count in sorted_trans[:15]:
+    transitions = Counter()
+    for word, cvs in PARSED_WORDS:
+        cons = [c for c, _ in cvs]
+        transitions.update((c1, c2) for c1, c2 in zip(cons, cons[1:]) if c1 and c2)
+
+    # most_common(n) selects with a heap rather than sorting every pair
+    for (c1, c2), count in transitions.most_common(15):
         print(f"  {c1:3s} → {c2:3s}:  {count:3d}")
 
     return freq, classes, transitions
@@ -270,6 +264,18 @@ def analyze_consonants():
 # SECTION 4: VOWEL HARMONY ANALYSIS
 # =============================================================================
 
+# Front vowels: e, i -> F
+# Back vowels: o, u -> B
+# Neutral: a (unchanged)
+_HARMONY_CLASSES = str.maketrans("eiou", "FFBB")
+
+
+def _harmony_counts(vowels):
+    """(front, back, neutral) counts for a word's vowels, tallied by str.count."""
+    classes = "".join(vowels).translate(_HARMONY_CLASSES)
+    return classes.count("F"), classes.count("B"), classes.count("a")
+
+
 def analyze_vowel_harmony():
     """Check for vowel harmony — a key diagnostic of language family."""
     print("\n" + "=" * 70)
@@ -285,23 +291,11 @@ def analyze_vowel_harmony():
     harmony_scores = []
     word_analyses = []
 
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        vowels = []
-        for s in syls:
-            _, v = extract_cv(s)
-            if v:
-                vowels.append(v)
-
+    for word, vowels in WORD_VOWELS:
         if len(vowels) < 2:
             continue
 
-        # Front vowels: e, i
-        # Back vowels: o, u
-        # Neutral: a
-        front = sum(1 for v in vowels if v in "ei")
-        back = sum(1 for v in vowels if v in "ou")
-        neutral = sum(1 for v in vowels if v == "a")
+        front, back, neutral = _harmony_counts(vowels)
 
         # Harmony score: proportion of non-neutral vowels that agree
         non_neutral = front + back
@@ -357,10 +351,9 @@ def analyze_rhythm():
 
     # Word length in syllables
     lengths = []
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        if syls:
-            lengths.append((word, len(syls)))
+    for word, cvs in PARSED_WORDS:
+        if cvs:
+            lengths.append((word, len(cvs)))
 
     length_freq = Counter(n for _, n in lengths)
     total_words = len(lengths)
@@ -371,7 +364,7 @@ def analyze_rhythm():
     for n in sorted(length_freq.keys()):
         count = length_freq[n]
         pct = count / total_words * 100
-        bar = "█" * int(pct * 2)
+        bar = _bar(pct * 2)
         print(f"  {n} syllables:  {count:3d}  ({pct:5.1f}%)  {bar}")
 
     # Compare to known languages
@@ -390,7 +383,7 @@ def analyze_rhythm():
     ]
     for lang, length in sorted(comparisons, key=lambda x: x[1]):
         marker = " ◄◄◄" if lang.startswith("MINOAN") else ""
-        bar = "█" * int(length * 5)
+        bar = _bar(length * 5)
         print(f"  {lang:<22s}  {length:.1f} syl  {bar}{marker}")
 
     # Syllable weight analysis
@@ -453,48 +446,29 @@ def analyze_phonotactics():
     print("=" * 70)
 
     # Build CV grid: which C-V combinations actually occur
-    cv_grid = defaultdict(int)
-    all_cv = []
+    cv_grid = Counter(cv for _, cvs in PARSED_WORDS for cv in cvs if cv[1])
 
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        for s in syls:
-            c, v = extract_cv(s)
-            if v:
-                cv_grid[(c, v)] += 1
-                all_cv.append((c, v))
-
-    consonants = sorted(set(c for c, v in all_cv if c))
+    consonants = sorted(set(c for c, v in cv_grid if c))
     vowels_list = "aeiou"
 
+    # One row of a/e/i/o/u counts per consonant ("" = bare vowel)
+    grid_rows = {c: [cv_grid.get((c, v), 0) for v in vowels_list] for c in [""] + consonants}
+
     print(f"\nCV OCCURRENCE GRID (consonant × vowel):")
-    print(f"  {'':>5s}", end="")
-    for v in vowels_list:
-        print(f"  {v:>4s}", end="")
-    print(f"  {'TOTAL':>6s}")
+    header = "".join(f"  {v:>4s}" for v in vowels_list)
+    print(f"  {'':>5s}{header}  {'TOTAL':>6s}")
     print(f"  {'─' * 38}")
 
-    for c in [""] + consonants:
+    for c, counts in grid_rows.items():
         label = c if c else "V"
-        print(f"  {label:>5s}", end="")
-        row_total = 0
-        for v in vowels_list:
-            count = cv_grid.get((c, v), 0)
-            row_total += count
-            if count > 0:
-                print(f"  {count:>4d}", end="")
-            else:
-                print(f"  {'·':>4s}", end="")
-        print(f"  {row_total:>6d}")
+        cells = "".join(f"  {count:>4d}" if count else f"  {'·':>4s}" for count in counts)
+        print(f"  {label:>5s}{cells}  {sum(counts):>6d}")
 
     # Identify gaps (forbidden or unattested combinations)
     print(f"\n{'─' * 40}")
     print("UNATTESTED CV COMBINATIONS (possible phonotactic gaps):")
-    gaps = []
-    for c in consonants:
-        for v in vowels_list:
-            if cv_grid.get((c, v), 0) == 0:
-                gaps.append(f"{c}{v}")
+    gaps = [f"{c}{v}" for c in consonants
+            for v, count in zip(vowels_list, grid_rows[c]) if not count]
     if gaps:
         print(f"  {', '.join(gaps)}")
         print(f"  ({len(gaps)} gaps out of {len(consonants) * 5} possible combinations)")
@@ -507,10 +481,9 @@ def analyze_phonotactics():
     initial_types = Counter()
     vowel_initial = 0
     consonant_initial = 0
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        if syls:
-            c, v = extract_cv(syls[0])
+    for word, cvs in PARSED_WORDS:
+        if cvs:
+            c, v = cvs[0]
             if c:
                 consonant_initial += 1
                 initial_types[f"C{v.upper()}" if v else "C"] += 1
@@ -576,10 +549,9 @@ def diagnostic_summary(vowel_distances, harmony_scores, avg_length, cv_grid, gap
 
     # Vowel-initial words
     all_cv = []
-    for word in ALL_WORDS:
-        syls = parse_syllables(word)
-        if syls:
-            c, _ = extract_cv(syls[0])
+    for word, cvs in PARSED_WORDS:
+        if cvs:
+            c, _ = cvs[0]
             all_cv.append(c)
     vowel_init_pct = sum(1 for c in all_cv if not c) / len(all_cv) * 100
     if vowel_init_pct > 25:
@@ -630,22 +602,26 @@ def diagnostic_summary(vowel_distances, harmony_scores, avg_length, cv_grid, gap
 # =============================================================================
 
 if __name__ == "__main__":
-    print("╔══════════════════════════════════════════════════════════════════════╗")
-    print("║   LINEAR A PHONOLOGICAL ANALYSIS — HOW MINOAN SOUNDS        ║")
-    print("╠══════════════════════════════════════════════════════════════════════╣")
-    print("║  Analyzing: vowels, consonants, harmony, rhythm, phonotactics      ║")
-    print("║  Comparing: Hurrian, Sumerian, Hittite, Semitic, Greek, Etruscan   ║")
-    print("║  Date: 2026-02-27                                                   ║")
-    print("╚══════════════════════════════════════════════════════════════════════╝")
-
-    vowel_freq, word_vowels, vowel_distances = analyze_vowels()
-    cons_freq, classes, transitions = analyze_consonants()
-    harmony_scores = analyze_vowel_harmony()
-    lengths, avg_length = analyze_rhythm()
-    cv_grid, gaps = analyze_phonotactics()
-
-    diagnostic_summary(vowel_distances, harmony_scores, avg_length, cv_grid, gaps)
-
-    print("═" * 70)
-    print("Analysis complete. Run LINEAR_A_STRUCTURAL_ANALYSIS.py for grammar.")
-    print("═" * 70)
+    # Collect the whole report and write it to stdout in one go
+    with redirect_stdout(io.StringIO()) as report:
+        print("╔══════════════════════════════════════════════════════════════════════╗")
+        print("║   LINEAR A PHONOLOGICAL ANALYSIS — HOW MINOAN SOUNDS        ║")
+        print("╠══════════════════════════════════════════════════════════════════════╣")
+        print("║  Analyzing: vowels, consonants, harmony, rhythm, phonotactics      ║")
+        print("║  Comparing: Hurrian, Sumerian, Hittite, Semitic, Greek, Etruscan   ║")
+        print("║  Date: 2026-02-27                                                   ║")
+        print("╚══════════════════════════════════════════════════════════════════════╝")
+
+        vowel_freq, word_vowels, vowel_distances = analyze_vowels()
+        cons_freq, classes, transitions = analyze_consonants()
+        harmony_scores = analyze_vowel_harmony()
+        lengths, avg_length = analyze_rhythm()
+        cv_grid, gaps = analyze_phonotactics()
+
+        diagnostic_summary(vowel_distances, harmony_scores, avg_length, cv_grid, gaps)
+
+        print("═" * 70)
+        print("Analysis complete. Run LINEAR_A_STRUCTURAL_ANALYSIS.py for grammar.")
+        print("═" * 70)
+
+    sys.stdout.write(report.getvalue())
@@ -3,42 +3,63 @@
 
 import json
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import combinations
+from operator import attrgetter
+from typing import NamedTuple
 
-with open('/tmp/lineara.xyz/items_analysis/inscriptions.json') as f:
-    data = json.load(f)
+# Fields of each inscription record that the analyses below read
+USED_FIELDS = ('site', 'support', 'transliteratedWords')
 
-IDEOGRAMS = {
+def load_inscriptions(path):
+    """Load [tablet_id, info] entries, keeping only USED_FIELDS of each info
+    dict so the rest of the parsed record can be freed straight away."""
+    with open(path) as f:
+        return [[tablet_id, {k: info[k] for k in USED_FIELDS if k in info}]
+                for tablet_id, info in json.load(f)]
+
+data = load_inscriptions('/tmp/lineara.xyz/items_analysis/inscriptions.json')
+
+IDEOGRAMS = frozenset({
     'OLE', 'OLE+U', 'OLE+A', 'OLE+E', 'OLE+KI', 'OLE+MI', 'OLE+DI',
     'OLE+NE', 'OLE+TA', 'OLE+RI', 'OLE+QIf', 'OLE+TU', 'OLE+RA',
     'GRA', 'VIN', 'FIC', 'NI', 'CYP', 'BOS', 'OVISm', 'OVISf',
     'CAPm', 'CAPf', 'SUS', 'TELA', 'LANA', 'AES', 'AUR', 'OLIV',
     'ARE', 'AROM',
-}
+})
 
-KNOWN_VOCAB = {'KU-RO', 'KI-RO', 'SA-RA\u2082', 'JE-DI', 'RE-ZA', 'KA-PA', 'A-DU', 'SA-RO'}
+KNOWN_VOCAB = frozenset({'KU-RO', 'KI-RO', 'SA-RA\u2082', 'JE-DI', 'RE-ZA', 'KA-PA', 'A-DU', 'SA-RO'})
+
+# Anything float() accepts: digits with optional '_' separators, decimal
+# point, exponent, inf/nan, surrounding whitespace
+_NUMBER_RE = re.compile(
+    r'\s*[+-]?(?:(?:(?:\d(?:_?\d)*)?\.\d(?:_?\d)*|\d(?:_?\d)*\.?)(?:[eE][+-]?\d(?:_?\d)*)?'
+    r'|(?i:inf(?:inity)?|nan))\s*')
+_NON_WORDS = frozenset({'', '\n', '\u1001'})
 
 def is_number(w):
-    try:
-        float(w)
-        return True
-    except:
-        return False
+    return _NUMBER_RE.fullmatch(w) is not None
 
 def is_word(w):
-    if not w or w == '\n':
-        return False
-    if ord(w[0]) > 0xFFFF:
-        return False
-    if w == '\u1001' or (len(w) == 1 and ord(w) > 127):
+    if w in _NON_WORDS or ord(w[0]) > 0xFFFF or (len(w) == 1 and ord(w) > 127):
         return False
-    if is_number(w):
-        return False
-    return True
+    return not is_number(w)
 
 def is_commodity(w):
     return w in IDEOGRAMS or w.startswith('OLE')
 
+# Word list of every tablet, and an inverted index word -> indices into data
+# of the tablets it occurs on; built once and shared by the sections below
+tablet_words = [info.get('transliteratedWords', []) for _, info in data]
+word_tablets = defaultdict(list)
+for i, words in enumerate(tablet_words):
+    for w in dict.fromkeys(words):
+        word_tablets[w].append(i)
+
+# is_word() of every distinct token, evaluated once per word rather than
+# once per occurrence
+word_flags = {w: is_word(w) for w in word_tablets}
+
 # ============================================================
 # 1. POSITIONAL ANALYSIS — Where does each word appear on tablets?
 # ============================================================
@@ -46,47 +67,67 @@ print("=" * 80)
 print("POSITIONAL ANALYSIS — Word positions within tablet lines")
 print("=" * 80)
 
-# Track: for each word, what POSITION does it appear in?
-# Position = (line_number, position_in_line)
-word_positions = defaultdict(list)  # word -> [(tablet_id, line_num, pos_in_line, total_in_line)]
-word_line_positions = defaultdict(lambda: defaultdict(int))  # word -> {first/middle/last -> count}
+def positional_pass(entries):
+    """Positional accumulators for a run of corpus entries.
 
-for entry in data:
-    tablet_id = entry[0]
-    info = entry[1]
-    words = info.get('transliteratedWords', [])
-    
-    # Split into lines
-    lines = [[]]
-    for w in words:
-        if w == '\n':
-            lines.append([])
-        elif is_word(w):
-            lines[-1].append(w)
-    
-    for line_num, line_words in enumerate(lines):
-        if not line_words:
-            continue
-        total = len(line_words)
-        for pos, w in enumerate(line_words):
-            word_positions[w].append((tablet_id, line_num, pos, total))
-            if pos == 0:
-                word_line_positions[w]['first'] += 1
-            elif pos == total - 1:
-                word_line_positions[w]['last'] += 1
-            else:
-                word_line_positions[w]['middle'] += 1
+    Returns (word_positions, word_line_positions, name_seen). Results from
+    separate slices of the corpus merge by extend/update; name_seen holds
+    (word, tablet_id) pairs, so its union never counts a tablet twice.
+    """
+    # Track: for each word, what POSITION does it appear in?
+    # Position = (line_number, position_in_line)
+    word_positions = defaultdict(list)  # word -> [(tablet_id, line_num, pos_in_line, total_in_line)]
+    word_line_positions = defaultdict(Counter)  # word -> {first/middle/last -> count}
+    # Multi-sign words (potential names) and the tablets they occur on, for
+    # section 2 -- collected in the same pass over the corpus. A dict rather
+    # than a set so the pairs keep first-sighting order.
+    name_seen = {}  # (word, tablet_id) -> None
+
+    for entry in entries:
+        tablet_id = entry[0]
+        info = entry[1]
+        words = info.get('transliteratedWords', [])
+
+        # Split into lines
+        lines = [[]]
+        for w in words:
+            if w == '\n':
+                lines.append([])
+            elif is_word(w):
+                lines[-1].append(w)
+                # Multi-sign, not a commodity, reconstructed or known word
+                if ('-' in w and not is_commodity(w) and not w.startswith('*')
+                        and w not in KNOWN_VOCAB):
+                    name_seen[w, tablet_id] = None
+
+        for line_num, line_words in enumerate(lines):
+            if not line_words:
+                continue
+            total = len(line_words)
+            for pos, w in enumerate(line_words):
+                word_positions[w].append((tablet_id, line_num, pos, total))
+                if pos == 0:
+                    word_line_positions[w]['first'] += 1
+                elif pos == total - 1:
+                    word_line_positions[w]['last'] += 1
+                else:
+                    word_line_positions[w]['middle'] += 1
+
+    return word_positions, word_line_positions, name_seen
+
+word_positions, word_line_positions, name_seen = positional_pass(data)
+name_counts = Counter(w for w, _ in name_seen)  # word -> number of distinct tablets
 
 # Find words with strong positional preferences
 print(f"\n{'Word':25s} {'Total':>6s} {'First%':>7s} {'Middle%':>8s} {'Last%':>7s}  Position Preference")
 print("-" * 85)
 
 position_findings = []
-for w in sorted(word_line_positions.keys(), key=lambda x: -sum(word_line_positions[x].values())):
-    counts = word_line_positions[w]
-    total = sum(counts.values())
+line_totals = Counter({w: counts.total() for w, counts in word_line_positions.items()})
+for w, total in line_totals.most_common():
     if total < 5:
-        continue
+        break  # most_common() is descending, so every later word is rarer
+    counts = word_line_positions[w]
     first_pct = counts['first'] / total * 100
     middle_pct = counts['middle'] / total * 100
     last_pct = counts['last'] / total * 100
@@ -111,25 +152,16 @@ print(f"\n\n{'='*80}")
 print("CROSS-TABLET NAME TRACKING — Multi-sign words appearing on 3+ tablets")
 print(f"{'='*80}")
 
-# Find multi-sign words (potential names) that recur across tablets
-name_candidates = defaultdict(set)  # word -> set of tablet_ids
-for entry in data:
-    tablet_id = entry[0]
-    info = entry[1]
-    words = info.get('transliteratedWords', [])
-    for w in words:
-        if not is_word(w):
-            continue
-        if '-' in w and not is_commodity(w) and w not in KNOWN_VOCAB and not w.startswith('*'):
-            name_candidates[w].add(tablet_id)
-
-# Filter to words on 3+ tablets
-recurring_names = {w: tablets for w, tablets in name_candidates.items() if len(tablets) >= 3}
+# Collect tablet ids only for name candidates counted on 3+ tablets
+recurring_names = {w: {data[i][0] for i in word_tablets[w]}  # word -> set of tablet_ids
+                   for w, n in name_counts.items() if n >= 3}
 
 print(f"\nMulti-sign words on 3+ tablets: {len(recurring_names)}")
 print(f"\n{'Word':30s} {'Tablets':>8s}  Tablet IDs")
 print("-" * 80)
-for w in sorted(recurring_names.keys(), key=lambda x: -len(recurring_names[x])):
+# Most widespread first; name_counts[w] == len(recurring_names[w])
+ranked_names = [w for w, n in name_counts.most_common(len(recurring_names))]
+for w in ranked_names:
     tablets = recurring_names[w]
     tablet_list = ', '.join(sorted(tablets)[:6])
     if len(tablets) > 6:
@@ -143,28 +175,49 @@ print(f"\n\n{'='*80}")
 print("CO-OCCURRENCE NETWORK — Names appearing together on same tablets")
 print(f"{'='*80}")
 
-# Build co-occurrence matrix for recurring multi-sign words
-recurring_list = sorted(recurring_names.keys(), key=lambda x: -len(recurring_names[x]))[:30]
-cooccurrences = defaultdict(lambda: defaultdict(int))
+# Build co-occurrence matrix for recurring multi-sign words. Pairs of each
+# tablet are generated and tallied in C (combinations + Counter.update).
+# Only pairs involving one of the 30 listed names are ever reported.
+recurring_list = ranked_names[:30]
+recurring_set = frozenset(recurring_names)
+listed_set = frozenset(recurring_list)
+pair_counts = Counter()
+
+for words in tablet_words:
+    if listed_set.isdisjoint(words):
+        continue  # none of its pairs can be reported: skip the tablet
+    # Kept as a list, not a set intersection: repeats and order feed the counts
+    present = [w for w in words if w in recurring_set]
+    pair_counts.update(combinations(present, 2))
 
-for entry in data:
-    tablet_id = entry[0]
-    info = entry[1]
-    words = info.get('transliteratedWords', [])
-    present = [w for w in words if w in recurring_names]
-    for i, w1 in enumerate(present):
-        for w2 in present[i+1:]:
-            cooccurrences[w1][w2] += 1
-            cooccurrences[w2][w1] += 1
+# The matrix is symmetric: keep the upper triangle only, one (a, b) key with
+# a <= b per pair
+cooccurrences = Counter()
+for (w1, w2), n in pair_counts.items():
+    cooccurrences[(w1, w2) if w1 <= w2 else (w2, w1)] += n
+
+# Partners of each listed name, in first-seen order
+rank = {w: i for i, w in enumerate(recurring_list)}
+partners = defaultdict(list)
+for (w1, w2), n in cooccurrences.items():
+    if w1 == w2:
+        if w1 in rank:
+            partners[w1].append((w1, 2 * n))  # a repeated name counts from both sides
+        continue
+    if w1 in rank:
+        partners[w1].append((w2, n))
+    if w2 in rank:
+        partners[w2].append((w1, n))
 
 print(f"\n{'Word A':25s} {'Word B':25s} {'Co-occur':>9s}")
 print("-" * 65)
-shown = set()
-for w1 in recurring_list:
-    for w2 in sorted(cooccurrences[w1].keys(), key=lambda x: -cooccurrences[w1][x]):
-        if cooccurrences[w1][w2] >= 2 and (w2, w1) not in shown:
-            print(f"  {w1:23s} {w2:23s} {cooccurrences[w1][w2]:9d}")
-            shown.add((w1, w2))
+for i, w1 in enumerate(recurring_list):
+    for w2, n in sorted(partners[w1], key=lambda x: -x[1]):
+        if n < 2:
+            break
+        # Each pair is listed once, under whichever name ranks higher
+        if rank.get(w2, i) >= i:
+            print(f"  {w1:23s} {w2:23s} {n:9d}")
 
 # ============================================================
 # 4. SITE DISTRIBUTION — Do words cluster by site?
@@ -173,31 +226,38 @@ print(f"\n\n{'='*80}")
 print("SITE DISTRIBUTION — Where do recurring words appear?")
 print(f"{'='*80}")
 
-word_sites = defaultdict(lambda: defaultdict(int))
-for entry in data:
-    tablet_id = entry[0]
-    info = entry[1]
+# Count flat (word, site) keys with Counter.update, then group them per word;
+# EAFP on the usually-present word key avoids a default factory per access
+tracked = recurring_set | KNOWN_VOCAB
+site_pairs = Counter()
+for (tablet_id, info), words in zip(data, tablet_words):
     site = info.get('site', 'unknown')
-    words = info.get('transliteratedWords', [])
-    for w in words:
-        if w in recurring_names or w in KNOWN_VOCAB:
-            word_sites[w][site] += 1
+    site_pairs.update((w, site) for w in words if w in tracked)
+
+word_sites = {}  # word -> Counter of site -> occurrences
+word_totals = Counter()  # word -> occurrences over all sites
+for (w, site), n in site_pairs.items():
+    try:
+        word_sites[w][site] = n
+    except KeyError:
+        word_sites[w] = Counter({site: n})
+    word_totals[w] += n
 
 # Find words that are site-specific
 print(f"\n{'Word':25s} {'Sites':>6s}  Distribution")
 print("-" * 80)
-for w in sorted(word_sites.keys(), key=lambda x: -sum(word_sites[x].values()))[:40]:
+for w, total in word_totals.most_common(40):
     sites = word_sites[w]
-    total = sum(sites.values())
     if total < 3:
         continue
-    site_str = ', '.join(f'{s}:{n}' for s, n in sorted(sites.items(), key=lambda x: -x[1])[:4])
+    top_sites = sites.most_common(4)  # top_sites[0] doubles as the max site
+    site_str = ', '.join(f'{s}:{n}' for s, n in top_sites)
     num_sites = len(sites)
     marker = ''
     if num_sites == 1:
         marker = ' ← SITE-SPECIFIC'
-    elif max(sites.values()) / total > 0.8:
-        marker = f' ← CONCENTRATED ({max(sites, key=sites.get)})'
+    elif top_sites[0][1] / total > 0.8:
+        marker = f' ← CONCENTRATED ({top_sites[0][0]})'
     print(f"  {w:23s} {num_sites:6d}  {site_str}{marker}")
 
 # ============================================================
@@ -207,29 +267,29 @@ print(f"\n\n{'='*80}")
 print("LIBATION FORMULA TABLETS — Structural analysis")
 print(f"{'='*80}")
 
+# Libation formula (WA-JA, A-TA-I) and a-sa-sa-ra-me (SA-SA-RA) markers
+_LIBATION_RE = re.compile('WA-JA|A-TA-I|SA-SA-RA')
+
+class LibationTablet(NamedTuple):
+    id: str
+    site: str
+    support: str
+    words: tuple
+
 libation_tablets = []
-for entry in data:
-    tablet_id = entry[0]
-    info = entry[1]
-    words = info.get('transliteratedWords', [])
-    word_strs = [w for w in words if is_word(w)]
-    
-    # Check for libation formula elements
-    has_formula = any('WA-JA' in w for w in word_strs) or any('A-TA-I' in w for w in word_strs)
-    has_asasarame = any('SA-SA-RA' in w for w in word_strs)
+for (tablet_id, info), words in zip(data, tablet_words):
+    word_strs = [w for w in words if word_flags[w]]
     
-    if has_formula or has_asasarame:
-        libation_tablets.append({
-            'id': tablet_id,
-            'site': info.get('site', '?'),
-            'support': info.get('support', '?'),
-            'words': word_strs,
-        })
+    # Check for libation formula elements (formula or a-sa-sa-ra-me), all
+    # three markers tested in one scan of each word
+    if any(map(_LIBATION_RE.search, word_strs)):
+        libation_tablets.append(LibationTablet(
+            tablet_id, info.get('site', '?'), info.get('support', '?'), tuple(word_strs)))
 
 print(f"\nLibation-related tablets found: {len(libation_tablets)}")
-for tab in sorted(libation_tablets, key=lambda t: t['id']):
-    word_str = ' | '.join(tab['words'][:15])
-    print(f"\n  {tab['id']} ({tab['site']}, {tab['support']})")
+for tab in sorted(libation_tablets, key=attrgetter('id')):
+    word_str = ' | '.join(tab.words[:15])
+    print(f"\n  {tab.id} ({tab.site}, {tab.support})")
     print(f"    {word_str}")
 
 # ============================================================
@@ -243,16 +303,6 @@ print(f"{'='*80}")
 print(f"\n  LINE-INITIAL words with commodity associations (likely PLACE NAMES or CATEGORIES):")
 for w, total, first_pct, mid_pct, last_pct, pref in position_findings:
     if first_pct > 55 and total >= 5:
-        # Check commodity associations
-        tablets_with_word = set()
-        for entry in data:
-            tablet_id = entry[0]
-            words = entry[1].get('transliteratedWords', [])
-            if w in words:
-                tablets_with_word.add(tablet_id)
-                commodities = [x for x in words if is_commodity(x)]
-                if commodities:
-                    pass
         if '-' in w:
             print(f"    {w:25s} first:{first_pct:.0f}% ({total}x) — likely header/category")
 
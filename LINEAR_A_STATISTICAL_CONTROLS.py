@@ -14,8 +14,16 @@ This is the defense layer that turns "cool hypothesis" into "measurably best und
 
 import random
 import math
+import heapq
 from datetime import datetime
-from collections import Counter
+from array import array
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import accumulate, chain
+from statistics import fmean
+from operator import add, itemgetter, mul
+from types import MappingProxyType
 
 random.seed(42)  # Reproducible results
 
@@ -277,33 +285,61 @@ LANGUAGE_FAMILIES = {
 # SCORING ENGINE — Same pipeline for all families
 # ============================================================================
 
+VOWEL_ORDER = ("a", "i", "u", "e", "o")
+
+def vowel_proportions(vowels):
+    """Vowel percentages as a tuple of proportions in VOWEL_ORDER."""
+    return tuple(vowels.get(v, 0) / 100.0 for v in VOWEL_ORDER)
+
 def vowel_distance(target, reference):
     """KL-divergence-inspired distance between vowel distributions."""
+    return _kl_from_proportions(vowel_proportions(target), vowel_proportions(reference))
+
+def _kl_from_proportions(target_p, reference_p):
     dist = 0
-    for v in ["a", "i", "u", "e", "o"]:
-        t = target.get(v, 0) / 100.0
-        r = reference.get(v, 0) / 100.0
+    for t, r in zip(target_p, reference_p):
         if t > 0 and r > 0:
             dist += t * math.log2(t / r)
     return dist
 
+# Linear A side of every vowel comparison, converted once
+LA_VOWEL_P = vowel_proportions(LINEAR_A["vowels"])
+
 def score_vowels(family_data):
     """Score vowel system match. Uses Hattusha dialect if available."""
     best_vowels = family_data.get("hattusha_vowels") or family_data["vowels"]
-    kl_div = vowel_distance(LINEAR_A["vowels"], best_vowels)
+    kl_div = _kl_from_proportions(LA_VOWEL_P, vowel_proportions(best_vowels))
     # Convert KL divergence to score: 0 div = 100%, 1.0 div = 0%
     # Empirically calibrated: kl_div for Hurrian-Hattusha ≈ 0.04, for Egyptian ≈ 0.15
     score = max(0, 100 - kl_div * 500)
     return min(100, score)
 
+FEATURE_ORDER = tuple(LINEAR_A["features"])
+
+def feature_masks(features):
+    """(True, False) bitmasks of a feature dict over FEATURE_ORDER.
+
+    Bit i is set in the first mask if feature i is True, in the second if it
+    is False; a missing feature sets neither, so it never matches.
+    """
+    true_bits = false_bits = 0
+    for i, feat in enumerate(FEATURE_ORDER):
+        val = features.get(feat)
+        if val is True:
+            true_bits |= 1 << i
+        elif val is False:
+            false_bits |= 1 << i
+    return true_bits, false_bits
+
+# Linear A side of every feature comparison, encoded once
+LA_FEATURE_MASKS = feature_masks(LINEAR_A["features"])
+
 def score_features(family_data):
     """Score structural feature overlap."""
-    matches = 0
-    total = len(LINEAR_A["features"])
-    for feat, la_val in LINEAR_A["features"].items():
-        if family_data["features"].get(feat) == la_val:
-            matches += 1
-    return (matches / total) * 100
+    la_true, la_false = LA_FEATURE_MASKS
+    fam_true, fam_false = feature_masks(family_data["features"])
+    matches = (la_true & fam_true).bit_count() + (la_false & fam_false).bit_count()
+    return (matches / len(FEATURE_ORDER)) * 100
 
 def score_cases(family_data):
     """Score case suffix similarity."""
@@ -330,6 +366,29 @@ def score_family(family_name, family_data):
     overall = sum(scores.values()) / len(scores)
     return scores, overall
 
+@cache
+def family_scores(family_name):
+    """score_family() of a LANGUAGE_FAMILIES entry, computed once per run.
+
+    The reference data never changes during a run, so baseline, ablation,
+    bootstrap and weighting tests share one result. The scores mapping is
+    read-only because it is shared.
+    """
+    scores, overall = score_family(family_name, LANGUAGE_FAMILIES[family_name])
+    return MappingProxyType(scores), overall
+
+@cache
+def score_matrix():
+    """Dimension names and each reference family's scores as a row tuple.
+
+    Returns (dimensions, {family: row}) with rows in LANGUAGE_FAMILIES order
+    and columns in dimension order -- the family x dimension table the
+    ablation and bootstrap tests index by position.
+    """
+    dimensions = tuple(family_scores("Hurro-Urartian")[0])
+    rows = {fname: tuple(family_scores(fname)[0].values()) for fname in LANGUAGE_FAMILIES}
+    return dimensions, MappingProxyType(rows)
+
 
 # ============================================================================
 # TEST 1: BASELINE DISTRIBUTION — All families through same pipeline
@@ -342,8 +401,8 @@ def run_baseline_comparison():
     print("=" * 80)
 
     results = {}
-    for name, data in sorted(LANGUAGE_FAMILIES.items()):
-        scores, overall = score_family(name, data)
+    for name in sorted(LANGUAGE_FAMILIES):
+        scores, overall = family_scores(name)
         results[name] = (scores, overall)
 
     # Print ranked results
@@ -398,8 +457,7 @@ def run_ablation_analysis():
     print("  Drop each dimension → measure impact on Hurro-Urartian ranking")
     print("=" * 80)
 
-    hurrian_data = LANGUAGE_FAMILIES["Hurro-Urartian"]
-    full_scores, full_overall = score_family("Hurro-Urartian", hurrian_data)
+    _, full_overall = family_scores("Hurro-Urartian")
 
     print(f"\n  Full pipeline score: {full_overall:.1f}%")
     print(f"\n  {'Dimension Removed':<25} │ {'New Score':>10} │ {'Δ':>8} │ {'Impact':>10} │ Still #1?")
@@ -407,13 +465,13 @@ def run_ablation_analysis():
 
     ablation_results = []
 
-    for drop_dim in full_scores.keys():
-        # Recompute without this dimension for ALL families
+    dimensions, rows = score_matrix()
+
+    for drop_idx, drop_dim in enumerate(dimensions):
+        # Recompute without this dimension (column) for ALL families
         all_family_scores = {}
-        for fname, fdata in LANGUAGE_FAMILIES.items():
-            scores, _ = score_family(fname, fdata)
-            reduced = {k: v for k, v in scores.items() if k != drop_dim}
-            reduced_avg = sum(reduced.values()) / len(reduced)
+        for fname, row in rows.items():
+            reduced_avg = sum(v for j, v in enumerate(row) if j != drop_idx) / (len(row) - 1)
             all_family_scores[fname] = reduced_avg
 
         hurrian_reduced = all_family_scores["Hurro-Urartian"]
@@ -448,63 +506,108 @@ def run_ablation_analysis():
 # TEST 3: BOOTSTRAP CONFIDENCE INTERVALS
 # ============================================================================
 
-def run_bootstrap_test(n_iterations=10000):
+def _bootstrap_kernel(family_dim_scores, n_iterations, rng=random):
+    """Resample dimensions with replacement n_iterations times.
+
+    Pure resampling loop, kept apart from the report so it can be swapped
+    for a compiled or alternative-statistic version. Draws from rng, the
+    seeded module-level random stream by default. Returns
+    ({family: array('d') of per-iteration means}, array('B') of per-iteration
+    Hurro-Urartian ranks), both preallocated to n_iterations.
+    """
+    n_dims = len(family_dim_scores["Hurro-Urartian"])
+    dim_rows = list(family_dim_scores.items())
+    randrange = rng.randrange  # same draws as randint(0, n_dims - 1)
+
+    bootstrap_scores = {fname: array('d', [0.0]) * n_iterations for fname in family_dim_scores}
+    hurrian_rank = array('B', [0]) * n_iterations
+    hurrian_idx = list(family_dim_scores).index("Hurro-Urartian")
+    columns = [(dims, bootstrap_scores[fname]) for fname, dims in dim_rows]
+
+    for it in range(n_iterations):
+        # One index draw per iteration, gathered from every family's row in C
+        resample = itemgetter(*[randrange(n_dims) for _ in range(n_dims)])
+
+        iter_scores = []
+        for dims, column in columns:
+            avg = sum(resample(dims)) / n_dims
+            iter_scores.append(avg)
+            column[it] = avg
+
+        # Hurrian's rank is 1 + the number of families scoring strictly higher
+        # (no sort needed). Ties go to Hurrian, as the stable sort did with
+        # Hurro-Urartian listed first.
+        hurrian_score = iter_scores[hurrian_idx]
+        hurrian_rank[it] = 1 + sum(score > hurrian_score for score in iter_scores)
+
+    return bootstrap_scores, hurrian_rank
+
+def _bootstrap_chunk(args):
+    """Worker entry point: one independently seeded slice of the bootstrap."""
+    family_dim_scores, n_iterations, seed = args
+    return _bootstrap_kernel(family_dim_scores, n_iterations, random.Random(seed))
+
+def _parallel_bootstrap(family_dim_scores, n_iterations, workers):
+    """Split the iterations over worker processes and concatenate in order.
+
+    Each slice gets its own Random seeded from the module stream, so a given
+    worker count is reproducible, but the draws differ from the serial run.
+    """
+    sizes = [n_iterations // workers + (k < n_iterations % workers) for k in range(workers)]
+    jobs = [(family_dim_scores, n, random.randrange(2**32)) for n in sizes]
+
+    bootstrap_scores = {fname: array('d') for fname in family_dim_scores}
+    hurrian_rank = array('B')
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_scores, chunk_rank in pool.map(_bootstrap_chunk, jobs):
+            for fname, values in chunk_scores.items():
+                bootstrap_scores[fname].extend(values)
+            hurrian_rank.extend(chunk_rank)
+    return bootstrap_scores, hurrian_rank
+
+def run_bootstrap_test(n_iterations=10000, workers=1):
     print("\n" + "=" * 80)
     print(f"  TEST 3: BOOTSTRAP CONFIDENCE INTERVALS (n={n_iterations})")
     print("  Resample dimensions with replacement → distribution of scores")
     print("=" * 80)
 
-    # Get all dimension scores for each family
-    family_dim_scores = {}
-    for fname, fdata in LANGUAGE_FAMILIES.items():
-        scores, _ = score_family(fname, fdata)
-        family_dim_scores[fname] = list(scores.values())
-
-    n_dims = len(family_dim_scores["Hurro-Urartian"])
+    # Get all dimension scores for each family (a plain dict, so it pickles)
+    family_dim_scores = dict(score_matrix()[1])
 
     # Bootstrap: resample dimensions with replacement
-    bootstrap_scores = {fname: [] for fname in LANGUAGE_FAMILIES}
-    hurrian_rank = []
-    hurrian_wins = 0
-
-    for _ in range(n_iterations):
-        indices = [random.randint(0, n_dims - 1) for _ in range(n_dims)]
-
-        iter_scores = {}
-        for fname in LANGUAGE_FAMILIES:
-            dims = family_dim_scores[fname]
-            resampled = [dims[i] for i in indices]
-            avg = sum(resampled) / len(resampled)
-            iter_scores[fname] = avg
-            bootstrap_scores[fname].append(avg)
-
-        # Check if Hurrian is #1
-        ranked = sorted(iter_scores.items(), key=lambda x: x[1], reverse=True)
-        rank = [r[0] for r in ranked].index("Hurro-Urartian") + 1
-        hurrian_rank.append(rank)
-        if rank == 1:
-            hurrian_wins += 1
+    if workers > 1:
+        bootstrap_scores, hurrian_rank = _parallel_bootstrap(family_dim_scores, n_iterations, workers)
+    else:
+        bootstrap_scores, hurrian_rank = _bootstrap_kernel(family_dim_scores, n_iterations)
 
     # Compute confidence intervals
     print(f"\n  {'Language Family':<20} │ {'Mean':>7} │ {'95% CI':>16} │ {'Min':>7} │ {'Max':>7}")
     print("  " + "─" * 65)
 
-    for fname in sorted(LANGUAGE_FAMILIES.keys(),
-                        key=lambda x: -sum(bootstrap_scores[x])/len(bootstrap_scores[x])):
-        scores = sorted(bootstrap_scores[fname])
-        mean = sum(scores) / len(scores)
+    # Sort each distribution and take its mean once; the table order, the
+    # percentiles and the min/max all read from these
+    sorted_scores = {fname: sorted(bootstrap_scores[fname]) for fname in LANGUAGE_FAMILIES}
+    means = {fname: fmean(scores) for fname, scores in sorted_scores.items()}
+
+    for fname in sorted(LANGUAGE_FAMILIES.keys(), key=lambda x: -means[x]):
+        scores = sorted_scores[fname]
+        mean = means[fname]
         ci_low = scores[int(0.025 * n_iterations)]
         ci_high = scores[int(0.975 * n_iterations)]
-        lo = min(scores)
-        hi = max(scores)
+        lo = scores[0]
+        hi = scores[-1]
         print(f"  {fname:<20} │ {mean:>6.1f}% │ [{ci_low:>5.1f}%, {ci_high:>5.1f}%] │ {lo:>6.1f}% │ {hi:>6.1f}%")
 
-    # Rank distribution for Hurrian
+    # Rank distribution for Hurrian: ranks are dense small ints, so count each
+    # possible rank directly (array.count is a C scan over the byte array)
+    rank_counts = [hurrian_rank.count(rank) for rank in range(len(LANGUAGE_FAMILIES) + 1)]
+    hurrian_wins = rank_counts[1]
     win_pct = (hurrian_wins / n_iterations) * 100
-    rank_counts = Counter(hurrian_rank)
 
     print(f"\n  Hurro-Urartian ranking across {n_iterations} bootstrap iterations:")
-    for rank in sorted(rank_counts.keys()):
+    for rank in range(1, len(rank_counts)):
+        if not rank_counts[rank]:
+            continue
         pct = (rank_counts[rank] / n_iterations) * 100
         bar = "█" * int(pct / 2)
         print(f"    Rank {rank}: {rank_counts[rank]:>6} ({pct:>5.1f}%)  {bar}")
@@ -524,10 +627,16 @@ def run_bootstrap_test(n_iterations=10000):
 # TEST 4: LEXICAL CHANCE-MATCH CONTROL
 # ============================================================================
 
-def run_lexical_control(n_pseudo=1000):
+def run_lexical_control(n_pseudo=1000, skip_bigrams=False):
+    # skip_bigrams=True also matches 1-skip bigrams (each character paired
+    # with the one after next), a fuzzier similarity that separates real
+    # from random lexicons with fewer pseudo-lexicons. Off by default so
+    # the reported numbers stay comparable with earlier runs.
     print("\n" + "=" * 80)
     print(f"  TEST 4: LEXICAL CHANCE-MATCH CONTROL (n={n_pseudo} pseudo-lexicons)")
     print("  Generate random CV syllable strings → compare to Hurrian")
+    if skip_bigrams:
+        print("  Similarity: contiguous + 1-skip bigrams")
     print("=" * 80)
 
     # Linear A syllabary (CV structure)
@@ -535,6 +644,10 @@ def run_lexical_control(n_pseudo=1000):
     vowels_list = ["a", "i", "u", "e", "o"]
     # Weight vowels to match Linear A distribution
     vowel_weights = [43.3, 20.6, 17.5, 14.4, 4.1]
+    # Cumulative weights for a bisect draw, as random.choices makes them
+    vowel_cum_weights = list(accumulate(vowel_weights))
+    vowel_total = vowel_cum_weights[-1]
+    vowel_hi = len(vowels_list) - 1
 
     # Hurrian comparison lexicon (simplified phonemic forms)
     hurrian_words = [
@@ -547,22 +660,42 @@ def run_lexical_control(n_pseudo=1000):
     def generate_pseudo_word(min_syl=2, max_syl=5):
         """Generate a random word matching Linear A syllable structure."""
         n_syl = random.randint(min_syl, max_syl)
-        word = ""
-        for _ in range(n_syl):
-            c = random.choice(consonants)
-            # Weighted vowel selection
-            v = random.choices(vowels_list, weights=vowel_weights, k=1)[0]
-            word += c + v
-        return word
-
-    def phonetic_similarity(w1, w2):
-        """Simple phonetic similarity: shared bigrams / max bigrams."""
-        bg1 = set(w1[i:i+2] for i in range(len(w1)-1))
-        bg2 = set(w2[i:i+2] for i in range(len(w2)-1))
-        if not bg1 or not bg2:
+        # Consonant, then weighted vowel: the same draws as random.choice()
+        # followed by random.choices(k=1), without the per-call setup
+        choice, rand = random.choice, random.random
+        return "".join(
+            choice(consonants)
+            + vowels_list[bisect(vowel_cum_weights, rand() * vowel_total, 0, vowel_hi)]
+            for _ in range(n_syl)
+        )
+
+    # Each distinct CV bigram gets one bit, so a word's bigram set is an
+    # int mask and set intersection is a single AND + bit_count
+    bigram_bit = {}
+
+    def bigram_mask(w):
+        mask = 0
+        # Pair each character with its successor lazily; no index slicing
+        pairs = map(add, w, w[1:])
+        if skip_bigrams:
+            pairs = chain(pairs, map(add, w, w[2:]))
+        for bg in pairs:
+            mask |= 1 << bigram_bit.setdefault(bg, len(bigram_bit))
+        return mask
+
+    # The Hurrian side never changes, so encode it once
+    hurrian_masks = [(m, m.bit_count()) for m in map(bigram_mask, hurrian_words)]
+
+    def best_similarity(w):
+        """Best phonetic similarity of one word against the Hurrian lexicon.
+
+        Similarity is shared bigrams / max bigrams.
+        """
+        m1 = bigram_mask(w)
+        n1 = m1.bit_count()
+        if not n1:
             return 0
-        shared = len(bg1 & bg2)
-        return shared / max(len(bg1), len(bg2))
+        return max((m1 & m2).bit_count() / max(n1, n2) for m2, n2 in hurrian_masks)
 
     # Actual Linear A words
     la_words = ["atai", "sasara", "dakuna", "idamate", "dupure",
@@ -571,28 +704,38 @@ def run_lexical_control(n_pseudo=1000):
     # Score actual Linear A against Hurrian
     actual_scores = []
     for la in la_words:
-        best = max(phonetic_similarity(la, h) for h in hurrian_words)
-        actual_scores.append(best)
-    actual_mean = sum(actual_scores) / len(actual_scores)
-
-    # Score pseudo-lexicons against Hurrian
-    pseudo_means = []
+        actual_scores.append(best_similarity(la))
+    actual_mean = fmean(actual_scores)
+
+    # Score pseudo-lexicons against Hurrian. Each lexicon's mean is folded
+    # into the running statistics straight away instead of being stored:
+    # total, count at or above the actual mean, histogram bucket, and a
+    # min-heap of the top 5% (both percentiles live in that tail).
+    n_words = len(la_words)
+    tail_size = n_pseudo - int(0.95 * n_pseudo)
+    tail = []
+    pseudo_total = 0
+    above_actual = 0
+    buckets = [0] * 20
     for _ in range(n_pseudo):
-        pseudo_words = [generate_pseudo_word() for _ in range(len(la_words))]
-        pseudo_scores = []
-        for pw in pseudo_words:
-            best = max(phonetic_similarity(pw, h) for h in hurrian_words)
-            pseudo_scores.append(best)
-        pseudo_means.append(sum(pseudo_scores) / len(pseudo_scores))
-
-    # Statistics
-    pseudo_avg = sum(pseudo_means) / len(pseudo_means)
-    pseudo_sorted = sorted(pseudo_means)
-    percentile_95 = pseudo_sorted[int(0.95 * n_pseudo)]
-    percentile_99 = pseudo_sorted[int(0.99 * n_pseudo)]
+        pseudo_words = [generate_pseudo_word() for _ in range(n_words)]
+        pm = fmean(map(best_similarity, pseudo_words))
+        pseudo_total += pm
+        if pm >= actual_mean:
+            above_actual += 1
+        buckets[min(19, int(pm * 20 / 0.5))] += 1
+        if len(tail) < tail_size:
+            heapq.heappush(tail, pm)
+        else:
+            heapq.heappushpop(tail, pm)
+
+    # Statistics (ascending index k is descending index n_pseudo - 1 - k)
+    pseudo_avg = pseudo_total / n_pseudo
+    top = sorted(tail, reverse=True)
+    percentile_95 = top[n_pseudo - 1 - int(0.95 * n_pseudo)]
+    percentile_99 = top[n_pseudo - 1 - int(0.99 * n_pseudo)]
 
     # Where does actual score fall?
-    above_actual = sum(1 for p in pseudo_means if p >= actual_mean)
     p_value = above_actual / n_pseudo
 
     print(f"\n  Actual Linear A ↔ Hurrian similarity:    {actual_mean:.4f}")
@@ -611,19 +754,15 @@ def run_lexical_control(n_pseudo=1000):
 
     # Distribution visualization
     print(f"\n  Distribution of random pseudo-lexicon scores:")
-    buckets = [0] * 20
-    for pm in pseudo_means:
-        idx = min(19, int(pm * 20 / 0.5))
-        buckets[idx] += 1
-
+    # Bucket edges once; the actual mean's bucket (if within 0-0.5) once
+    edges = [i * 0.5 / 20 for i in range(21)]
+    actual_bin = bisect(edges, actual_mean) - 1 if actual_mean >= edges[0] else -1
     max_count = max(buckets)
-    for i in range(20):
-        lower = i * 0.5 / 20
-        upper = (i + 1) * 0.5 / 20
-        bar_len = int(buckets[i] / max_count * 40) if max_count > 0 else 0
+    for i, count in enumerate(buckets):
+        bar_len = int(count / max_count * 40) if max_count > 0 else 0
         bar = "█" * bar_len
-        marker = " ◀ ACTUAL" if lower <= actual_mean < upper else ""
-        print(f"    {lower:.3f}-{upper:.3f}: {bar}{marker}")
+        marker = " ◀ ACTUAL" if i == actual_bin else ""
+        print(f"    {edges[i]:.3f}-{edges[i+1]:.3f}: {bar}{marker}")
 
     return actual_mean, pseudo_avg, p_value
 
@@ -632,75 +771,117 @@ def run_lexical_control(n_pseudo=1000):
 # TEST 5: SIGN-READING PERTURBATION ROBUSTNESS
 # ============================================================================
 
-def run_perturbation_test(n_trials=1000):
-    print("\n" + "=" * 80)
-    print(f"  TEST 5: SIGN-READING PERTURBATION TEST (n={n_trials})")
-    print("  Randomly perturb 10-30% of sign values → does Hurrian still win?")
-    print("=" * 80)
-
-    # Feature list for perturbation
-    feature_names = list(LINEAR_A["features"].keys())
-
-    perturbation_levels = [0.10, 0.15, 0.20, 0.25, 0.30]
-
-    print(f"\n  {'Perturbation':<15} │ {'Hurrian Mean':>13} │ {'Still #1':>10} │ {'Confidence':>12}")
-    print("  " + "─" * 60)
+def _perturbation_kernel(families, hurrian_idx, perturb_pct, n_trials, rng=random):
+    """Run n_trials perturbation trials at one perturbation level.
 
-    all_results = {}
+    families holds one (score row, feature masks..., case values, vocabulary
+    values) tuple per family in LANGUAGE_FAMILIES order. Draws from rng, the
+    seeded module-level random stream by default. Returns (array('d') of
+    per-trial Hurro-Urartian scores, number of trials Hurro-Urartian won).
+    """
+    la_true, la_false = LA_FEATURE_MASKS
+    n_features = len(FEATURE_ORDER)
+    n_flip = int(n_features * perturb_pct)
+    vocab_sigma = 10 * perturb_pct
+    case_sigma = 15 * perturb_pct
 
-    for perturb_pct in perturbation_levels:
-        hurrian_wins = 0
-        hurrian_scores_list = []
+    hurrian_wins = 0
+    hurrian_scores = array('d', [0.0]) * n_trials
+    # Trial scores by family index; the winner is the first maximum, so a
+    # tie goes to the family listed earlier
+    scores_this = [0.0] * len(families)
+    family_idx = range(len(families))
+
+    for t in range(n_trials):
+        # Perturb and score every family
+        for j, (row, fam_true, fam_false, cases, vocab) in enumerate(families):
+            # Randomly flip features (only those the family defines)
+            flip = 0
+            for idx in rng.sample(range(n_features), n_flip):
+                flip |= 1 << idx
+            flip &= fam_true | fam_false
+            matches = ((la_true & (fam_true ^ flip)).bit_count()
+                       + (la_false & (fam_false ^ flip)).bit_count())
+            feature_score = (matches / n_features) * 100
+
+            # Perturb vocabulary scores slightly
+            p_vocab = [max(0, min(100, base + rng.gauss(0, vocab_sigma)))
+                       for base in vocab]
+
+            # Perturb case similarities
+            p_cases = [max(0, min(100, base + rng.gauss(0, case_sigma)))
+                       for base in cases]
+
+            # Same column order and summation as score_family()
+            overall = sum((row[0], feature_score,
+                           sum(p_cases) / len(p_cases),
+                           sum(p_vocab) / len(p_vocab),
+                           *row[4:])) / len(row)
+            scores_this[j] = overall
+
+        hurrian_scores[t] = scores_this[hurrian_idx]
+
+        if max(family_idx, key=scores_this.__getitem__) == hurrian_idx:
+            hurrian_wins += 1
 
-        for _ in range(n_trials):
-            # Create perturbed versions of ALL families' features
-            perturbed_families = {}
+    return hurrian_scores, hurrian_wins
 
-            for fname, fdata in LANGUAGE_FAMILIES.items():
-                p_data = dict(fdata)
-                p_features = dict(fdata["features"])
+def _perturbation_chunk(args):
+    """Worker entry point: one independently seeded slice of the trials."""
+    families, hurrian_idx, perturb_pct, n_trials, seed = args
+    return _perturbation_kernel(families, hurrian_idx, perturb_pct, n_trials, random.Random(seed))
 
-                # Randomly flip features
-                n_flip = int(len(feature_names) * perturb_pct)
-                flip_indices = random.sample(range(len(feature_names)), n_flip)
+def _parallel_perturbation(families, hurrian_idx, perturb_pct, n_trials, workers):
+    """Split the trials over worker processes and combine in order.
 
-                for idx in flip_indices:
-                    feat = feature_names[idx]
-                    if feat in p_features:
-                        p_features[feat] = not p_features[feat]
+    Seeded per slice from the module stream, like _parallel_bootstrap.
+    """
+    sizes = [n_trials // workers + (k < n_trials % workers) for k in range(workers)]
+    jobs = [(families, hurrian_idx, perturb_pct, n, random.randrange(2**32)) for n in sizes]
 
-                p_data["features"] = p_features
+    hurrian_scores = array('d')
+    hurrian_wins = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_scores, chunk_wins in pool.map(_perturbation_chunk, jobs):
+            hurrian_scores.extend(chunk_scores)
+            hurrian_wins += chunk_wins
+    return hurrian_scores, hurrian_wins
 
-                # Perturb vocabulary scores slightly
-                p_vocab = dict(fdata["vocabulary_matches"])
-                for word in p_vocab:
-                    noise = random.gauss(0, 10 * perturb_pct)
-                    p_vocab[word] = max(0, min(100, p_vocab[word] + noise))
-                p_data["vocabulary_matches"] = p_vocab
+def run_perturbation_test(n_trials=1000, workers=1):
+    print("\n" + "=" * 80)
+    print(f"  TEST 5: SIGN-READING PERTURBATION TEST (n={n_trials})")
+    print("  Randomly perturb 10-30% of sign values → does Hurrian still win?")
+    print("=" * 80)
 
-                # Perturb case similarities
-                p_cases = dict(fdata["case_similarity"])
-                for case in p_cases:
-                    noise = random.gauss(0, 15 * perturb_pct)
-                    p_cases[case] = max(0, min(100, p_cases[case] + noise))
-                p_data["case_similarity"] = p_cases
+    perturbation_levels = [0.10, 0.15, 0.20, 0.25, 0.30]
 
-                perturbed_families[fname] = p_data
+    print(f"\n  {'Perturbation':<15} │ {'Hurrian Mean':>13} │ {'Still #1':>10} │ {'Confidence':>12}")
+    print("  " + "─" * 60)
 
-            # Score all families
-            scores_this = {}
-            for fname, p_data in perturbed_families.items():
-                _, overall = score_family(fname, p_data)
-                scores_this[fname] = overall
+    all_results = {}
 
-            hurrian_scores_list.append(scores_this.get("Hurro-Urartian", 0))
+    # Perturbation only touches features, case similarities and vocabulary.
+    # Everything else in a family's score row is fixed, and the features
+    # are flipped directly on their bitmasks.
+    _, rows = score_matrix()
+    families = [
+        (rows[fname], *feature_masks(fdata["features"]),
+         tuple(fdata["case_similarity"].values()),
+         tuple(fdata["vocabulary_matches"].values()))
+        for fname, fdata in LANGUAGE_FAMILIES.items()
+    ]
+    hurrian_idx = list(LANGUAGE_FAMILIES).index("Hurro-Urartian")
 
-            ranked = sorted(scores_this.items(), key=lambda x: x[1], reverse=True)
-            if ranked[0][0] == "Hurro-Urartian":
-                hurrian_wins += 1
+    for perturb_pct in perturbation_levels:
+        if workers > 1:
+            hurrian_scores, hurrian_wins = _parallel_perturbation(
+                families, hurrian_idx, perturb_pct, n_trials, workers)
+        else:
+            hurrian_scores, hurrian_wins = _perturbation_kernel(
+                families, hurrian_idx, perturb_pct, n_trials)
 
         win_pct = (hurrian_wins / n_trials) * 100
-        h_mean = sum(hurrian_scores_list) / len(hurrian_scores_list)
+        h_mean = fmean(hurrian_scores)
 
         confidence = "HIGH" if win_pct >= 90 else "MODERATE" if win_pct >= 70 else "LOW"
         print(f"  {perturb_pct*100:>5.0f}% flipped   │ {h_mean:>12.1f}% │ {win_pct:>9.1f}% │ {confidence:>12}")
@@ -734,9 +915,6 @@ def run_cultural_weight_test():
     print("  Test: what happens when we downweight or remove cultural dimensions?")
     print("=" * 80)
 
-    hurrian_data = LANGUAGE_FAMILIES["Hurro-Urartian"]
-    full_scores, full_overall = score_family("Hurro-Urartian", hurrian_data)
-
     # Define which dimensions are "cultural" vs "linguistic"
     linguistic_dims = ["Vowel system", "Structural features", "Case system", "Vocabulary"]
     cultural_dims = ["Religious parallel", "Geographic", "Timeline", "Scholarly support"]
@@ -751,26 +929,22 @@ def run_cultural_weight_test():
     print(f"\n  {'Scenario':<40} │ {'Hurrian':>8} │ {'#2':>20} │ {'Gap':>7} │ Still #1?")
     print("  " + "─" * 90)
 
-    for scenario_name, ling_weight, cult_weight in scenarios:
-        all_family_scores = {}
+    # Dimension kinds don't depend on the scenario or the family, so each
+    # scenario reduces to one weight vector dotted with every score row
+    dimensions, rows = score_matrix()
+    dim_kinds = ["cultural" if dim in cultural_dims
+                 else "linguistic" if dim in linguistic_dims
+                 else "other" for dim in dimensions]
 
-        for fname, fdata in LANGUAGE_FAMILIES.items():
-            scores, _ = score_family(fname, fdata)
-            weighted_sum = 0
-            weight_total = 0
-
-            for dim, val in scores.items():
-                if dim in cultural_dims:
-                    w = cult_weight
-                elif dim in linguistic_dims:
-                    w = ling_weight
-                else:
-                    w = 1.0
-                weighted_sum += val * w
-                weight_total += w
+    for scenario_name, ling_weight, cult_weight in scenarios:
+        kind_weight = {"cultural": cult_weight, "linguistic": ling_weight, "other": 1.0}
+        weights = [kind_weight[kind] for kind in dim_kinds]
+        weight_total = sum(weights)
 
+        all_family_scores = {}
+        for fname, row in rows.items():
             if weight_total > 0:
-                all_family_scores[fname] = weighted_sum / weight_total
+                all_family_scores[fname] = sum(map(mul, row, weights)) / weight_total
             else:
                 all_family_scores[fname] = 0
 
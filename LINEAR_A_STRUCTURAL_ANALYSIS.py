@@ -8,7 +8,8 @@ No external dependencies beyond Python 3 standard library.
 import json
 import math
 from collections import Counter, defaultdict
-from itertools import combinations
+from functools import cache
+from itertools import chain, combinations
 
 # =============================================================================
 # SECTION 1: LIBATION FORMULA CORPUS
@@ -89,11 +90,54 @@ LIBATION_FORMULAS = {
 # SECTION 2: SYLLABLE FREQUENCY ANALYSIS
 # =============================================================================
 
+@cache
 def parse_sign_sequence(seq):
-    """Parse a hyphenated sign sequence into individual signs."""
+    """Parse a hyphenated sign sequence into a tuple of individual signs.
+
+    Cached: variants repeat whole positions (e.g. α of Types 0 and 1), and
+    the tuple is shared by every caller, so it must not be mutated.
+    """
     if seq is None:
-        return []
-    return [s.strip() for s in seq.replace("?", "UNK").split("-") if s.strip()]
+        return ()
+    return tuple(s.strip() for s in seq.replace("?", "UNK").split("-") if s.strip())
+
+
+# Formula positions in reading order
+POSITIONS = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta")
+
+# Every formula position parsed once: name -> position -> tuple of signs
+# (empty for a missing position). All analyses below read from this.
+PARSED_FORMULAS = {
+    name: {pos: parse_sign_sequence(f.get(pos)) for pos in POSITIONS}
+    for name, f in LIBATION_FORMULAS.items()
+}
+
+# The same corpus as a flat list of per-position sign tuples, for analyses
+# that don't care which formula or position a sequence came from
+CORPUS_TOKENS = [signs for parsed in PARSED_FORMULAS.values() for signs in parsed.values()]
+
+# Integer id per distinct sign, in order of first appearance, and the corpus
+# re-encoded with those ids. Counting over ids needs no string hashing, and
+# a bigram packs into one int: first * len(SIGN_VOCAB) + second.
+SIGN_VOCAB = {sign: i for i, sign in enumerate(dict.fromkeys(chain.from_iterable(CORPUS_TOKENS)))}
+CORPUS_IDS = [tuple(SIGN_VOCAB[sign] for sign in signs) for signs in CORPUS_TOKENS]
+
+# Administrative features of Bronze Age accounting systems:
+# (feature, Sumerian, Egyptian, Linear B, Linear A)
+ADMIN_FEATURES = (
+    ("Total marker word", "YES", "YES", "YES", "YES"),
+    ("Commodity ideograms", "YES", "YES", "YES", "YES"),
+    ("Decimal number system", "NO(base60)", "YES", "YES", "YES"),
+    ("Fraction notation", "YES", "YES", "YES", "YES(base60)"),
+    ("Personal names in lists", "YES", "YES", "YES", "LIKELY"),
+    ("Place names in headers", "YES", "YES", "YES", "LIKELY"),
+    ("Multi-commodity lists", "YES", "YES", "YES", "YES"),
+    ("Receipts/roundels", "YES", "YES", "YES", "YES"),
+    ("Header-body-total format", "YES", "YES", "YES", "YES"),
+)
+
+# Which features Linear A shares, as one flag per row of ADMIN_FEATURES
+LINEAR_A_MATCH = tuple("YES" in a or "LIKELY" in a for *_, a in ADMIN_FEATURES)
 
 
 def analyze_syllable_frequencies():
@@ -102,18 +146,16 @@ def analyze_syllable_frequencies():
     print("SYLLABLE FREQUENCY ANALYSIS — LIBATION FORMULA CORPUS")
     print("=" * 70)
 
-    all_signs = []
-    position_signs = defaultdict(list)
+    freq = Counter()
+    position_freq = defaultdict(Counter)
 
-    for name, formula in LIBATION_FORMULAS.items():
-        for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-            signs = parse_sign_sequence(formula.get(pos))
-            all_signs.extend(signs)
-            position_signs[pos].extend(signs)
+    for parsed in PARSED_FORMULAS.values():
+        for pos, signs in parsed.items():
+            freq.update(signs)
+            position_freq[pos].update(signs)
 
     # Overall frequency
-    freq = Counter(all_signs)
-    total = len(all_signs)
+    total = freq.total()
 
     print(f"\nTotal sign tokens: {total}")
     print(f"Unique signs: {len(freq)}")
@@ -125,21 +167,45 @@ def analyze_syllable_frequencies():
     # Position-specific frequencies
     print(f"\n{'─' * 70}")
     print("POSITION-SPECIFIC ANALYSIS:")
-    for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-        signs = position_signs[pos]
-        if signs:
-            pos_freq = Counter(signs)
-            print(f"\n  Position {pos} ({len(signs)} tokens, {len(pos_freq)} unique):")
+    for pos in POSITIONS:
+        pos_freq = position_freq[pos]
+        if pos_freq:
+            print(f"\n  Position {pos} ({pos_freq.total()} tokens, {len(pos_freq)} unique):")
             for sign, count in pos_freq.most_common(5):
                 print(f"    {sign:12s}  {count:3d}")
 
-    return freq, position_signs
+    return freq, position_freq
 
 
 # =============================================================================
 # SECTION 3: MORPHOLOGICAL PATTERN DETECTION
 # =============================================================================
 
+def precompute_tags(formulas):
+    """Evaluate every morphological-rule predicate once per formula.
+
+    Returns {name: {tag: bool}}. A predicate on a missing position is False;
+    the rules check presence themselves where it matters.
+    """
+    def has_j(seq):
+        return seq.startswith("JA-") or seq.startswith("J-")
+
+    tags = {}
+    for name, f in formulas.items():
+        alpha, beta, gamma, delta, epsilon = (f.get(pos) or "" for pos in POSITIONS[:5])
+        tags[name] = {
+            "alpha_ends_e": alpha.endswith("-E"),
+            "alpha_ends_ti": alpha.endswith("-TI"),
+            "beta_has_j": has_j(beta),
+            "gamma_has_j": has_j(gamma),
+            "gamma_ends_na": gamma.endswith("-NA") or gamma.endswith("-MA-NA"),
+            "delta_has_ru": "-RU-" in delta,
+            "delta_ends_ti": delta.endswith("-TI"),
+            "epsilon_ends_mina": epsilon.endswith("-MI-NA"),
+        }
+    return tags
+
+
 def analyze_morphological_rules():
     """Test the proposed morphological agreement rules against the corpus."""
     print("\n" + "=" * 70)
@@ -150,14 +216,16 @@ def analyze_morphological_rules():
     rules_confirmed = 0
     rules_violated = 0
 
+    formula_tags = precompute_tags(LIBATION_FORMULAS)
+
     # Rule I: When β loses J- prefix → δ gains -RU- infix
     print("\n  Rule I: β loses J- → δ gains -RU-")
     for name, f in LIBATION_FORMULAS.items():
         beta = f.get("beta")
-        delta = f.get("delta")
-        if beta is not None and delta is not None:
-            beta_has_j = beta.startswith("JA-") or beta.startswith("J-")
-            delta_has_ru = "-RU-" in delta
+        if beta is not None and f.get("delta") is not None:
+            tags = formula_tags[name]
+            beta_has_j = tags["beta_has_j"]
+            delta_has_ru = tags["delta_has_ru"]
             if not beta_has_j and delta_has_ru:
                 print(f"    {name}: β='{beta[:20]}...' (no J-), δ has -RU- → CONFIRMED")
                 rules_confirmed += 1
@@ -175,59 +243,51 @@ def analyze_morphological_rules():
     # Rule II: α ends in -E → ε ends in -MI-NA, δ ends in -TI
     print("\n  Rule II: α ends -E → ε ends -MI-NA, δ ends -TI")
     for name, f in LIBATION_FORMULAS.items():
-        alpha = f.get("alpha")
-        epsilon = f.get("epsilon")
-        delta = f.get("delta")
-        if alpha is not None:
-            alpha_ends_e = alpha.endswith("-E")
-            if alpha_ends_e:
-                eps_match = epsilon is not None and epsilon.endswith("-MI-NA")
-                del_match = delta is not None and delta.endswith("-TI")
-                status = []
-                if epsilon is not None:
-                    status.append(f"ε ends -MI-NA: {'YES' if eps_match else 'NO'}")
-                if delta is not None:
-                    status.append(f"δ ends -TI: {'YES' if del_match else 'NO'}")
-                if status:
-                    confirmed = eps_match or del_match
-                    print(f"    {name}: α='{alpha}' → {', '.join(status)} → {'CONFIRMED' if confirmed else 'EXCEPTION'}")
-                    rules_tested += 1
-                    if confirmed:
-                        rules_confirmed += 1
-                    else:
-                        rules_violated += 1
+        tags = formula_tags[name]
+        if tags["alpha_ends_e"]:
+            eps_match = tags["epsilon_ends_mina"]
+            del_match = tags["delta_ends_ti"]
+            status = []
+            if f.get("epsilon") is not None:
+                status.append(f"ε ends -MI-NA: {'YES' if eps_match else 'NO'}")
+            if f.get("delta") is not None:
+                status.append(f"δ ends -TI: {'YES' if del_match else 'NO'}")
+            if status:
+                confirmed = eps_match or del_match
+                print(f"    {name}: α='{f['alpha']}' → {', '.join(status)} → {'CONFIRMED' if confirmed else 'EXCEPTION'}")
+                rules_tested += 1
+                if confirmed:
+                    rules_confirmed += 1
+                else:
+                    rules_violated += 1
 
     # Rule III: α ends in -TI → γ ends in -NA
     print("\n  Rule III: α ends -TI → γ ends -A-NA or -MA-NA")
     for name, f in LIBATION_FORMULAS.items():
-        alpha = f.get("alpha")
+        tags = formula_tags[name]
         gamma = f.get("gamma")
-        if alpha is not None and gamma is not None:
-            alpha_ends_ti = alpha.endswith("-TI")
-            if alpha_ends_ti:
-                gamma_ends_na = gamma.endswith("-NA") or gamma.endswith("-MA-NA")
-                print(f"    {name}: α='{alpha}', γ='{gamma}' → {'CONFIRMED' if gamma_ends_na else 'EXCEPTION'}")
-                rules_tested += 1
-                if gamma_ends_na:
-                    rules_confirmed += 1
-                else:
-                    rules_violated += 1
+        if tags["alpha_ends_ti"] and gamma is not None:
+            gamma_ends_na = tags["gamma_ends_na"]
+            print(f"    {name}: α='{f['alpha']}', γ='{gamma}' → {'CONFIRMED' if gamma_ends_na else 'EXCEPTION'}")
+            rules_tested += 1
+            if gamma_ends_na:
+                rules_confirmed += 1
+            else:
+                rules_violated += 1
 
     # Rule IV: α ends in -E → γ lacks J- prefix
     print("\n  Rule IV: α ends -E → γ lacks J-")
     for name, f in LIBATION_FORMULAS.items():
-        alpha = f.get("alpha")
+        tags = formula_tags[name]
         gamma = f.get("gamma")
-        if alpha is not None and gamma is not None:
-            alpha_ends_e = alpha.endswith("-E")
-            if alpha_ends_e:
-                gamma_no_j = not gamma.startswith("JA-") and not gamma.startswith("J-")
-                print(f"    {name}: α='{alpha}', γ='{gamma}' → {'CONFIRMED' if gamma_no_j else 'EXCEPTION'}")
-                rules_tested += 1
-                if gamma_no_j:
-                    rules_confirmed += 1
-                else:
-                    rules_violated += 1
+        if tags["alpha_ends_e"] and gamma is not None:
+            gamma_no_j = not tags["gamma_has_j"]
+            print(f"    {name}: α='{f['alpha']}', γ='{gamma}' → {'CONFIRMED' if gamma_no_j else 'EXCEPTION'}")
+            rules_tested += 1
+            if gamma_no_j:
+                rules_confirmed += 1
+            else:
+                rules_violated += 1
 
     # Summary
     print(f"\n{'─' * 70}")
@@ -249,40 +309,49 @@ def build_cooccurrence_network():
     print("SIGN CO-OCCURRENCE NETWORK ANALYSIS")
     print("=" * 70)
 
-    # Build adjacency (signs that appear next to each other)
-    adjacency = defaultdict(lambda: defaultdict(int))
-    all_sequences = []
-
-    for name, f in LIBATION_FORMULAS.items():
-        for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-            signs = parse_sign_sequence(f.get(pos))
-            all_sequences.append(signs)
-            for i in range(len(signs) - 1):
-                adjacency[signs[i]][signs[i+1]] += 1
-                adjacency[signs[i+1]][signs[i]] += 1
+    # Count ordered sign bigrams (signs that appear next to each other)
+    bigrams = Counter()
+    for signs in CORPUS_TOKENS:
+        bigrams.update(zip(signs, signs[1:]))
+
+    # Fold them into undirected adjacency: each pair is counted once, keyed
+    # with its signs in order of first appearance. The bigrams are in
+    # first-occurrence order, so pairs and signs keep the order a scan of
+    # the sequences would give them.
+    sign_id = {}
+    adjacency = Counter()
+    for (a, b), count in bigrams.items():
+        ia = sign_id.setdefault(a, len(sign_id))
+        ib = sign_id.setdefault(b, len(sign_id))
+        adjacency[(a, b) if ia <= ib else (b, a)] += count
 
     # Find most connected signs (degree centrality)
-    degree = {sign: len(neighbors) for sign, neighbors in adjacency.items()}
+    degree = dict.fromkeys(sign_id, 0)
+    for a, b in adjacency:
+        degree[a] += 1
+        if a != b:
+            degree[b] += 1
     sorted_degree = sorted(degree.items(), key=lambda x: -x[1])
 
+    def neighbor_counts(sign):
+        # A sign next to itself is adjacent from both ends
+        for (a, b), count in adjacency.items():
+            if a == sign:
+                yield b, 2 * count if a == b else count
+            elif b == sign:
+                yield a, count
+
     print(f"\nSign co-occurrence network: {len(degree)} nodes, {sum(degree.values())//2} edges")
     print(f"\nTop 10 by connectivity (degree centrality):")
     for sign, deg in sorted_degree[:10]:
-        neighbors = sorted(adjacency[sign].items(), key=lambda x: -x[1])
+        neighbors = sorted(neighbor_counts(sign), key=lambda x: -x[1])
         top_neighbors = ", ".join(f"{n}({c})" for n, c in neighbors[:3])
         print(f"  {sign:12s}  degree={deg:2d}  top neighbors: {top_neighbors}")
 
     # Identify clusters via simple component analysis
     print(f"\n{'─' * 70}")
     print("SIGN BIGRAMS (recurring pairs):")
-    bigrams = defaultdict(int)
-    for signs in all_sequences:
-        for i in range(len(signs) - 1):
-            bigram = (signs[i], signs[i+1])
-            bigrams[bigram] += 1
-
-    sorted_bigrams = sorted(bigrams.items(), key=lambda x: -x[1])
-    for bigram, count in sorted_bigrams[:15]:
+    for bigram, count in bigrams.most_common(15):
         if count >= 2:
             print(f"  {bigram[0]:8s} → {bigram[1]:8s}  appears {count} times")
 
@@ -299,47 +368,39 @@ def analyze_suffix_patterns():
     print("SUFFIX PATTERN ANALYSIS")
     print("=" * 70)
 
-    # Collect all word-final signs by position
-    final_signs = defaultdict(list)
-    initial_signs = defaultdict(list)
+    # One pass: word-final and word-initial sign counts by position, and
+    # each formula's per-position suffixes for the correlation table
+    final_signs = defaultdict(Counter)
+    initial_signs = defaultdict(Counter)
+    formula_suffixes = {}
 
-    for name, f in LIBATION_FORMULAS.items():
-        for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-            seq = f.get(pos)
-            if seq is not None:
-                signs = parse_sign_sequence(seq)
-                if signs:
-                    final_signs[pos].append(signs[-1])
-                    initial_signs[pos].append(signs[0])
+    for name, parsed in PARSED_FORMULAS.items():
+        suffixes = formula_suffixes[name] = {}
+        for pos, signs in parsed.items():
+            if signs:
+                final_signs[pos][signs[-1]] += 1
+                initial_signs[pos][signs[0]] += 1
+                suffixes[pos] = signs[-1]
 
     print("\nWORD-FINAL SIGNS (suffixes) by position:")
-    for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
+    for pos in POSITIONS:
         if final_signs[pos]:
-            freq = Counter(final_signs[pos])
             print(f"\n  Position {pos}:")
-            for sign, count in freq.most_common():
+            for sign, count in final_signs[pos].most_common():
                 print(f"    -{sign:8s}  {count} occurrences")
 
     print(f"\n{'─' * 70}")
     print("\nWORD-INITIAL SIGNS (prefixes) by position:")
-    for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
+    for pos in POSITIONS:
         if initial_signs[pos]:
-            freq = Counter(initial_signs[pos])
             print(f"\n  Position {pos}:")
-            for sign, count in freq.most_common():
+            for sign, count in initial_signs[pos].most_common():
                 print(f"    {sign:8s}-  {count} occurrences")
 
     # Cross-position suffix correlation
     print(f"\n{'─' * 70}")
     print("\nSUFFIX CORRELATIONS ACROSS POSITIONS:")
-    for name, f in LIBATION_FORMULAS.items():
-        suffixes = {}
-        for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-            seq = f.get(pos)
-            if seq is not None:
-                signs = parse_sign_sequence(seq)
-                if signs:
-                    suffixes[pos] = signs[-1]
+    for name, suffixes in formula_suffixes.items():
         if len(suffixes) >= 2:
             suffix_str = "  ".join(f"{p}:-{s}" for p, s in suffixes.items())
             print(f"  {name:25s}  {suffix_str}")
@@ -351,36 +412,52 @@ def analyze_suffix_patterns():
 # SECTION 6: INFORMATION-THEORETIC ANALYSIS
 # =============================================================================
 
+@cache
+def _xlogx(count):
+    # Counts in this corpus are small integers that repeat heavily, so each
+    # c * log2(c) is computed once and then looked up
+    return count * math.log2(count)
+
+
+def xlogx_sum(counts):
+    """sum(c * log2(c)) over positive counts.
+
+    Entropy follows from it as H = log2(N) - xlogx_sum / N: one log per
+    distinct count and no per-symbol division.
+    """
+    return sum(map(_xlogx, counts))
+
+
 def information_analysis():
     """Compute entropy and information content of the sign system."""
     print("\n" + "=" * 70)
     print("INFORMATION-THEORETIC ANALYSIS")
     print("=" * 70)
 
-    all_signs = []
-    for name, f in LIBATION_FORMULAS.items():
-        for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-            signs = parse_sign_sequence(f.get(pos))
-            all_signs.extend(signs)
+    # Sign tokens and sign bigrams, gathered in one pass over the id-encoded
+    # corpus: dense per-id counts for signs, packed int codes for bigrams
+    n_signs = len(SIGN_VOCAB)
+    sign_counts = [0] * n_signs
+    bigram_freq = Counter()
+    for ids in CORPUS_IDS:
+        for i in ids:
+            sign_counts[i] += 1
+        bigram_freq.update(a * n_signs + b for a, b in zip(ids, ids[1:]))
 
-    freq = Counter(all_signs)
-    total = len(all_signs)
+    total = sum(sign_counts)
 
     # Shannon entropy
-    entropy = 0
-    for count in freq.values():
-        p = count / total
-        if p > 0:
-            entropy -= p * math.log2(p)
+    sign_xlogx = xlogx_sum(sign_counts)
+    entropy = math.log2(total) - sign_xlogx / total
 
     # Maximum possible entropy (uniform distribution)
-    max_entropy = math.log2(len(freq))
+    max_entropy = math.log2(n_signs)
 
     # Redundancy
     redundancy = 1 - (entropy / max_entropy) if max_entropy > 0 else 0
 
     print(f"\n  Total tokens:       {total}")
-    print(f"  Unique signs:       {len(freq)}")
+    print(f"  Unique signs:       {n_signs}")
     print(f"  Shannon entropy:    {entropy:.3f} bits/sign")
     print(f"  Maximum entropy:    {max_entropy:.3f} bits/sign")
     print(f"  Redundancy:         {redundancy:.3f} ({redundancy*100:.1f}%)")
@@ -393,22 +470,14 @@ def information_analysis():
     print(f"    Random 90-sign:   {math.log2(90):.1f} bits/sign")
 
     # Bigram entropy
-    bigrams = []
-    for name, f in LIBATION_FORMULAS.items():
-        for pos in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
-            signs = parse_sign_sequence(f.get(pos))
-            for i in range(len(signs) - 1):
-                bigrams.append((signs[i], signs[i+1]))
-
-    bigram_freq = Counter(bigrams)
-    bigram_total = len(bigrams)
-    bigram_entropy = 0
-    for count in bigram_freq.values():
-        p = count / bigram_total
-        if p > 0:
-            bigram_entropy -= p * math.log2(p)
-
-    conditional_entropy = bigram_entropy - entropy
+    bigram_total = bigram_freq.total()
+    bigram_xlogx = xlogx_sum(bigram_freq.values())
+    bigram_entropy = math.log2(bigram_total) - bigram_xlogx / bigram_total
+
+    # H(X,Y) - H(X) straight from the count sums, with the two log2(N)
+    # terms folded into one, rather than subtracting two rounded entropies
+    conditional_entropy = (math.log2(bigram_total / total)
+                           - bigram_xlogx / bigram_total + sign_xlogx / total)
     print(f"\n  Bigram entropy:     {bigram_entropy:.3f} bits/bigram")
     print(f"  Conditional H(Y|X): {conditional_entropy:.3f} bits")
     print(f"  → Knowing one sign reduces uncertainty by {entropy - conditional_entropy:.3f} bits")
@@ -455,24 +524,11 @@ def administrative_pattern_analysis():
     print(f"\n{'Feature':<30s} {'Sumerian':>10s} {'Egyptian':>10s} {'Linear B':>10s} {'Linear A':>10s}")
     print("─" * 70)
 
-    features = [
-        ("Total marker word", "YES", "YES", "YES", "YES"),
-        ("Commodity ideograms", "YES", "YES", "YES", "YES"),
-        ("Decimal number system", "NO(base60)", "YES", "YES", "YES"),
-        ("Fraction notation", "YES", "YES", "YES", "YES(base60)"),
-        ("Personal names in lists", "YES", "YES", "YES", "LIKELY"),
-        ("Place names in headers", "YES", "YES", "YES", "LIKELY"),
-        ("Multi-commodity lists", "YES", "YES", "YES", "YES"),
-        ("Receipts/roundels", "YES", "YES", "YES", "YES"),
-        ("Header-body-total format", "YES", "YES", "YES", "YES"),
-    ]
-
-    match_count = 0
-    total_features = len(features)
-    for feat, s, e, b, a in features:
+    for feat, s, e, b, a in ADMIN_FEATURES:
         print(f"  {feat:<30s} {s:>10s} {e:>10s} {b:>10s} {a:>10s}")
-        if "YES" in a or "LIKELY" in a:
-            match_count += 1
+
+    match_count = sum(LINEAR_A_MATCH)
+    total_features = len(ADMIN_FEATURES)
 
     print(f"\n  Structural overlap with known systems: {match_count}/{total_features} ({match_count/total_features*100:.0f}%)")
     print(f"\n  CONCLUSION: Linear A administrative texts follow the SAME structural")